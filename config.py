@@ -1,11 +1,17 @@
 import os
 
+from modules.tracer import tracer  # isort: skip, traces imports below
+
 from ignis.app import IgnisApp
-from ignis.css_manager import CssInfoPath, CssManager
+from ignis.css_manager import CssInfoPath, CssInfoString, CssManager
 from ignis.services.niri import NiriService
-from ignis.utils import get_n_monitors, sass_compile
+from ignis.utils import get_n_monitors
 
+from modules.constants import WindowName
 from modules.prelude import post_initialized
+from modules.services import LazyWindowRegistry
+from modules.useroptions import user_options
+from modules.utils import cached_sass_compile, lookup_resource_text
 from modules.windows import (
     AppDock,
     AppLauncher,
@@ -25,24 +31,35 @@ css_manager = CssManager.get_default()
 niri = NiriService.get_default()
 
 config_dir = os.path.dirname(os.path.abspath(__file__))
-css_manager.apply_css(
-    CssInfoPath(
-        name="main", path=os.path.join(config_dir, "style.scss"), compiler_function=lambda path: sass_compile(path=path)
+# CSS compiled into the resource bundle, see `user_options.startup.gresource_bundle`
+bundled_css = lookup_resource_text("style.css")
+if bundled_css is not None:
+    css_manager.apply_css(CssInfoString(name="main", string=bundled_css))
+else:
+    css_manager.apply_css(
+        CssInfoPath(
+            name="main",
+            path=os.path.join(config_dir, "style.scss"),
+            compiler_function=cached_sass_compile,
+        )
     )
-)
 
-AppLauncher()
-ControlCenter()
-FcitxKimPopup()
-NotificationPopups()
-OnscreenDisplay()
-Preferences()
-TitleSetter()
+# windows below are built on first use, or in idle time if they react to events
+registry = LazyWindowRegistry.get_default()
+registry.register(WindowName.app_launcher.value, AppLauncher, prebuild=user_options.applauncher.prewarm)
+registry.register(WindowName.control_center.value, ControlCenter)
+registry.register(WindowName.kim_popup.value, FcitxKimPopup, prebuild=True)
+registry.register(WindowName.notification_popups.value, NotificationPopups, prebuild=True)
+registry.register(WindowName.osd.value, OnscreenDisplay, prebuild=True)
+registry.register(WindowName.preferences.value, Preferences)
+registry.register(WindowName.title_setter.value, TitleSetter, prebuild=True)
 
 for idx in range(get_n_monitors()):
-    Topbar(idx)
-    AppDock(idx)
-    OverlayBackdrop(idx)
+    for window_class in [Topbar, AppDock, OverlayBackdrop]:
+        with tracer.span(f"{window_class.__name__}({idx})", "window"):
+            window_class(idx)
+
+registry.start_prebuild(everything=user_options.startup.prebuild_windows)
 
 #    WallpaperWindow(idx)
 #    if niri.is_available:
@@ -8,7 +8,7 @@ from ..utils import (
     get_app_id,
     gtk_template,
     gtk_template_child,
-    run_cmd_async,
+    run_user_cmd,
     set_on_click,
     set_on_scroll,
 )
@@ -90,7 +90,7 @@ class ActiveWindow(Gtk.CenterBox):
                 case "MIDDLE":
                     cmd = self.__options.on_middle_click
             if cmd != "":
-                run_cmd_async(cmd)
+                run_user_cmd(cmd)
 
     def __on_scroll(self, dx: float, dy: float):
         if self.__options:
@@ -104,4 +104,4 @@ class ActiveWindow(Gtk.CenterBox):
             elif dy > 0:
                 cmd = self.__options.on_scroll_down
             if cmd != "":
-                run_cmd_async(cmd)
+                run_user_cmd(cmd)
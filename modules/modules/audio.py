@@ -1,11 +1,11 @@
 from ignis.services.audio import AudioService, Stream
 from ignis.widgets import Box, Icon
-from ignis.window_manager import WindowManager
 
 from ..constants import WindowName
+from ..services import LazyWindowRegistry
 from ..utils import set_on_click
 
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 class Audio(Box):
@@ -23,7 +23,7 @@ class Audio(Box):
             set_on_click(
                 self,
                 left=lambda _: stream.set_is_muted(not stream.is_muted),
-                right=lambda _: wm.toggle_window(WindowName.control_center.value),
+                right=lambda _: registry.toggle_window(WindowName.control_center.value),
             )
 
     def __init__(self):
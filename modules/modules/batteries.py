@@ -4,9 +4,9 @@ from gi.repository import Gio, Gtk
 from ignis.services.hyprland import HyprlandService
 from ignis.services.niri import NiriService
 from ignis.services.upower import UPowerDevice, UPowerService
-from ignis.window_manager import WindowManager
 
 from ..constants import WindowName
+from ..services import LazyWindowRegistry
 from ..utils import (
     SpecsBase,
     get_widget_monitor_id,
@@ -17,7 +17,7 @@ from ..utils import (
     set_on_click,
 )
 
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 @gtk_template("modules/batteries")
@@ -98,7 +98,7 @@ class Batteries(Gtk.Box):
         self.__add_action("logout", self.__logout_session)
 
         set_on_click(
-            self, left=lambda s: s.popover.popup(), right=lambda _: wm.toggle_window(WindowName.control_center.value)
+            self, left=lambda s: s.popover.popup(), right=lambda _: registry.toggle_window(WindowName.control_center.value)
         )
 
         self.__service.connect("battery_added", self.__on_battery_added)
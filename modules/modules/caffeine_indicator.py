@@ -1,14 +1,14 @@
 from gi.repository import Gtk
 from ignis.app import IgnisApp
 from ignis.widgets import Box, Icon, Window
-from ignis.window_manager import WindowManager
 
 from ..constants import WindowName
+from ..services import LazyWindowRegistry
 from ..utils import set_on_click
 from ..variables import caffeine_state
 
 app = IgnisApp.get_initialized()
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 class CaffeineIndicator(Box):
@@ -44,4 +44,4 @@ class CaffeineIndicator(Box):
         self.__state.value = not self.__state.value
 
     def __on_right_clicked(self, *_):
-        wm.toggle_window(WindowName.control_center.value)
+        registry.toggle_window(WindowName.control_center.value)
@@ -1,14 +1,12 @@
 import datetime
-import math
 
 from gi.repository import Gtk
-from ignis.utils import Poll
-from ignis.window_manager import WindowManager
 
 from ..constants import WindowName
+from ..services import LazyWindowRegistry, TickerService
 from ..utils import gtk_template, gtk_template_child, set_on_click
 
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 @gtk_template("modules/clock")
@@ -24,16 +22,15 @@ class Clock(Gtk.Box):
 
         set_on_click(self, left=self.__class__.__on_clicked, right=self.__class__.__on_right_clicked)
 
-        Poll(timeout=1000, callback=self.__on_change)
+        # on minute boundaries, shared by clocks on all monitors
+        TickerService.get_default().add(60 * 1000, self.__on_change, widget=self)
 
-    def __on_change(self, poll: Poll):
+    def __on_change(self):
         now = datetime.datetime.now()
 
         self.label.set_label(now.strftime("%H:%M"))
         self.label.set_tooltip_text(now.strftime("%Y-%m-%d"))
 
-        poll.set_timeout(60 * 1000 - math.floor(now.second * 1000 + now.microsecond / 1000))
-
     def __on_clicked(self, *_):
         now = datetime.datetime.now()
         self.calendar.set_year(now.year)
@@ -42,4 +39,4 @@ class Clock(Gtk.Box):
         self.popover.popup()
 
     def __on_right_clicked(self, *_):
-        wm.toggle_window(WindowName.control_center.value)
+        registry.toggle_window(WindowName.control_center.value)
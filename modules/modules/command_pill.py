@@ -1,6 +1,6 @@
 from gi.repository import Gtk
 
-from ..utils import GProperty, run_cmd_async
+from ..utils import GProperty, run_user_cmd
 
 
 class CommandPill(Gtk.Button):
@@ -14,7 +14,7 @@ class CommandPill(Gtk.Button):
 
     def __on_clicked(self, *_):
         if self._click_cmd != "":
-            run_cmd_async(self._click_cmd)
+            run_user_cmd(self._click_cmd)
 
     @GProperty(type=str)
     def click_command(self) -> str:
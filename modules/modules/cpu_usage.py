@@ -15,6 +15,7 @@ class CpuUsagePill(CommandPill):
         self.__cpu = CpuLoadService.get_default()
         self.__processors = self.__cpu.cpu_count
         self.__cpu.connect("notify::total-time", self.__on_updated)
+        self.__cpu.add_consumer(self)
 
     @GProperty(type=int)
     def interval(self) -> int:
@@ -1,11 +1,11 @@
 from ignis.options import options
 from ignis.widgets import Box, Icon
-from ignis.window_manager import WindowManager
 
 from ..constants import WindowName
+from ..services import LazyWindowRegistry
 from ..utils import connect_option, set_on_click
 
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 class DndIndicator(Box):
@@ -32,4 +32,4 @@ class DndIndicator(Box):
             self.__options.dnd = not self.__options.dnd
 
     def __on_right_clicked(self, *_):
-        wm.toggle_window(WindowName.control_center.value)
+        registry.toggle_window(WindowName.control_center.value)
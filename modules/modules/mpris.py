@@ -3,12 +3,12 @@ import asyncio
 from gi.repository import GObject, Gtk
 from ignis.services.mpris import ART_URL_CACHE_DIR, MprisPlayer, MprisService
 from ignis.widgets import Box
-from ignis.window_manager import WindowManager
 
 from ..constants import WindowName
+from ..services import LazyWindowRegistry
 from ..utils import SpecsBase, clear_dir, format_time_duration, gtk_template, gtk_template_child, set_on_click
 
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 class Mpris(Box):
@@ -80,7 +80,7 @@ class Mpris(Box):
                 ),
             )
 
-            set_on_click(self, right=lambda _: wm.toggle_window(WindowName.control_center.value))
+            set_on_click(self, right=lambda _: registry.toggle_window(WindowName.control_center.value))
 
         def do_dispose(self):
             self.clear_specs()
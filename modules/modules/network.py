@@ -1,11 +1,11 @@
 from ignis.services.network import Ethernet, NetworkService, Wifi
 from ignis.widgets import Box, Icon
-from ignis.window_manager import WindowManager
 
 from ..constants import WindowName
+from ..services import LazyWindowRegistry
 from ..utils import set_on_click
 
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 class Network(Box):
@@ -26,7 +26,7 @@ class Network(Box):
             self.set_tooltip_text("Connected" if connected else "Disconnected")
 
         def __on_clicked(self, *_):
-            wm.toggle_window(WindowName.control_center.value)
+            registry.toggle_window(WindowName.control_center.value)
 
     class NetworkWifi(Box):
         __gtype_name__ = "IgnisNetworkWifi"
@@ -40,7 +40,7 @@ class Network(Box):
             set_on_click(
                 self,
                 left=self.__class__.__on_clicked,
-                right=lambda _: wm.toggle_window(WindowName.control_center.value),
+                right=lambda _: registry.toggle_window(WindowName.control_center.value),
             )
 
         def __on_change(self, *_):
@@ -2,35 +2,26 @@ from gi.repository import Gtk
 from ignis.services.hyprland import HyprlandService, HyprlandWorkspace
 from ignis.services.niri import NiriService, NiriWorkspace
 
-from ..utils import SpecsBase, get_widget_monitor, niri_action, set_on_click, set_on_scroll
+from ..utils import FrameCoalescer, get_widget_monitor, niri_action, set_on_click, set_on_scroll
 
 
 class Workspaces(Gtk.Box):
     __gtype_name__ = "NiriWorkspaces"
 
-    class WorkspaceItem(Gtk.Box, SpecsBase):
+    class WorkspaceItem(Gtk.Box):
         __gtype_name__ = "WorkspaceItem"
 
         def __init__(self):
-            self.__niri = NiriService.get_default()
             self.__hypr = HyprlandService.get_default()
             self.__niri_ws: NiriWorkspace | None = None
             self.__hypr_ws: HyprlandWorkspace | None = None
+            self.__active: bool | None = None
             super().__init__()
-            SpecsBase.__init__(self)
 
             self.__icon = Gtk.Image(icon_name="pager-checked-symbolic")
             self.append(self.__icon)
 
             set_on_click(self, left=self.__class__.__on_clicked)
-            if self.__niri.is_available:
-                self.signal(self.__niri, "notify::active-workspace", self.__on_changed)
-            if self.__hypr.is_available:
-                self.signal(self.__hypr, "notify::active-workspace", self.__on_changed)
-
-        def do_dispose(self):
-            self.clear_specs()
-            super().do_dispose()  # type: ignore
 
         @property
         def is_active(self) -> bool:
@@ -47,7 +38,8 @@ class Workspaces(Gtk.Box):
         @niri_ws.setter
         def niri_ws(self, ws: NiriWorkspace):
             self.__niri_ws = ws
-            self.__on_changed()
+            self.set_tooltip_text(f"Workspace {ws.name or ws.idx}")
+            self.sync_active()
 
         @property
         def hypr_ws(self) -> HyprlandWorkspace | None:
@@ -56,22 +48,23 @@ class Workspaces(Gtk.Box):
         @hypr_ws.setter
         def hypr_ws(self, ws: HyprlandWorkspace):
             self.__hypr_ws = ws
-            self.__on_changed()
-
-        def __set_ws_active(self, active: bool):
+            self.set_tooltip_text(f"Workspace {ws.name or ws.id}")
+            self.sync_active()
+
+        def sync_active(self):
+            """
+            Updates styles if the active state of the workspace changed.
+            """
+            active = self.is_active
+            if active == self.__active:
+                return
+
+            self.__active = active
             if active:
                 self.remove_css_class("dimmed")
             else:
                 self.add_css_class("dimmed")
 
-        def __on_changed(self, *_):
-            if self.__niri_ws:
-                self.set_tooltip_text(f"Workspace {self.__niri_ws.name or self.__niri_ws.idx}")
-                self.__set_ws_active(self.is_active)
-            if self.__hypr_ws:
-                self.set_tooltip_text(f"Workspace {self.__hypr_ws.name or self.__hypr_ws.id}")
-                self.__set_ws_active(self.is_active)
-
         def __on_clicked(self, *_):
             if self.__niri_ws:
                 self.__niri_ws.switch_to()
@@ -82,7 +75,8 @@ class Workspaces(Gtk.Box):
         self.__niri = NiriService.get_default()
         self.__hypr = HyprlandService.get_default()
         self.__connector: str | None = None
-        self.__childs: list[Workspaces.WorkspaceItem] = []
+        self.__items: dict[int, Workspaces.WorkspaceItem] = {}
+        """Maps workspace id to ``WorkspaceItem``, in display order."""
         super().__init__()
 
         for css_class in ["hover", "rounded", "p-2"]:
@@ -91,41 +85,61 @@ class Workspaces(Gtk.Box):
         self.connect("realize", self.__class__.__on_realize)
         set_on_scroll(self, self.__class__.__on_scroll)
 
+        self.__coalescer = FrameCoalescer(self.__on_change, self, "Workspaces")
         if self.__niri.is_available:
-            self.__niri.connect("notify::workspaces", self.__on_change)
+            self.__niri.connect("notify::workspaces", self.__coalescer)
+            self.__niri.connect("notify::active-workspace", self.__on_active_changed)
 
         if self.__hypr.is_available:
-            self.__hypr.connect("notify::workspaces", self.__on_change)
-
-    def __new_item(self, niri_ws: NiriWorkspace | None = None, hypr_ws: HyprlandWorkspace | None = None):
-        item = self.WorkspaceItem()
-        if niri_ws:
-            item.niri_ws = niri_ws
-        if hypr_ws:
-            item.hypr_ws = hypr_ws
-        return item
+            self.__hypr.connect("notify::workspaces", self.__coalescer)
+            self.__hypr.connect("notify::active-workspace", self.__on_active_changed)
 
     def __on_realize(self):
         monitor = get_widget_monitor(self)
         if monitor:
             self.__connector = monitor.get_connector()
+        self.__coalescer()
 
     def __on_change(self, *_):
-        for item in self.__childs:
+        workspaces: list[NiriWorkspace | HyprlandWorkspace] = []
+        if self.__niri.is_available:
+            workspaces = sorted(
+                (ws for ws in self.__niri.workspaces if ws.output == self.__connector), key=lambda ws: ws.idx
+            )
+        if self.__hypr.is_available:
+            workspaces = sorted(
+                (ws for ws in self.__hypr.workspaces if ws.monitor == self.__connector), key=lambda ws: ws.id
+            )
+
+        # remove items of workspaces no longer exist
+        ws_ids = set(ws.id for ws in workspaces)
+        for ws_id in [ws_id for ws_id in self.__items if ws_id not in ws_ids]:
+            item = self.__items.pop(ws_id)
             self.remove(item)
             item.run_dispose()
-        self.__childs = []
 
-        if self.__niri.is_available:
-            self.__childs = [
-                self.__new_item(niri_ws=ws) for ws in self.__niri.workspaces if ws.output == self.__connector
-            ]
-        if self.__hypr.is_available:
-            self.__childs = [
-                self.__new_item(hypr_ws=ws) for ws in self.__hypr.workspaces if ws.monitor == self.__connector
-            ]
-        for item in self.__childs:
-            self.append(item)
+        # update existing items and insert missing ones, keeping the display order
+        items: dict[int, Workspaces.WorkspaceItem] = {}
+        previous: Workspaces.WorkspaceItem | None = None
+        for ws in workspaces:
+            item = self.__items.get(ws.id)
+            if not item:
+                item = self.WorkspaceItem()
+                self.insert_child_after(item, previous)
+            elif item.get_prev_sibling() is not previous:
+                self.reorder_child_after(item, previous)
+
+            if isinstance(ws, NiriWorkspace):
+                item.niri_ws = ws
+            else:
+                item.hypr_ws = ws
+            items[ws.id] = item
+            previous = item
+        self.__items = items
+
+    def __on_active_changed(self, *_):
+        for item in self.__items.values():
+            item.sync_active()
 
     def __on_scroll(self, dx: float, dy: float):
         if self.__niri.is_available:
@@ -1,7 +1,23 @@
-import modules.modules
-import modules.prelude.adw
+import os
+
+from modules.constants import CONFIG_DIR
+from modules.tracer import tracer
+from modules.useroptions import user_options
+from modules.utils.template import ensure_resource_bundle, prebuild_blueprints
+
+# compile stale blueprints in parallel, before any template class is declared
+with tracer.span("prebuild_blueprints", "blueprint"):
+    prebuild_blueprints()
+if user_options.startup.gresource_bundle:
+    with tracer.span("ensure_resource_bundle", "blueprint"):
+        ensure_resource_bundle(os.path.join(CONFIG_DIR, "style.scss"))
+
+import modules.modules  # noqa: E402
+import modules.prelude.adw  # noqa: E402
 
 
 def post_initialized():
     import modules.prelude.commands
     import modules.prelude.overrides
+
+    tracer.finish_when_idle()
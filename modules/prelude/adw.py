@@ -3,4 +3,7 @@ from gi import require_version
 require_version("Adw", "1")
 from gi.repository import Adw
 
-Adw.init()
+from ..tracer import tracer
+
+with tracer.span("Adw.init", "init"):
+    Adw.init()
@@ -1,28 +1,33 @@
 import asyncio
+import os
+from ignis import CACHE_DIR
 from ignis.command_manager import CommandManager
 from ignis.exceptions import WindowNotFoundError
-from ignis.window_manager import WindowManager
 from ignis.services.recorder import RecorderConfig, RecorderService
 from ignis.options import options
 from ..constants import WindowName
+from ..services import LazyWindowRegistry, MainLoopWatchdog, TickerService
+from ..tracer import tracer
 from ..useroptions import user_options
+from ..utils import AppInfoCache, FrameCoalescer, HandlerMonitor, LazyModule, benchmark_launch
+from ..windows.appdock import AppDockView
 
 
 cm = CommandManager.get_default()
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 recorder = RecorderService.get_default()
 
 
 def toggle_window(window_name: WindowName):
     try:
-        wm.toggle_window(window_name.value)
+        registry.toggle_window(window_name.value)
     except WindowNotFoundError:
         pass
 
 
 def open_window(window_name: WindowName):
     try:
-        wm.open_window(window_name.value)
+        registry.open_window(window_name.value)
     except WindowNotFoundError:
         pass
 
@@ -83,3 +88,112 @@ def toggle_recording(*_):
             stop_recording()
     else:
         start_recording()
+
+
+@cm.command(name="frame-coalesce-stats")
+def frame_coalesce_stats(*_):
+    return FrameCoalescer.report()
+
+
+@cm.command(name="dock-refresh-stats")
+def dock_refresh_stats(*_):
+    return AppDockView.report()
+
+
+@cm.command(name="startup-trace")
+def startup_trace(*args):
+    """
+    ``on``: trace the next start or reload, ``off``: stop tracing, ``report``: show the last trace.
+    """
+    mode = args[0] if args else "report"
+    if mode == "on":
+        os.makedirs(os.path.dirname(tracer.FLAG_FILE), exist_ok=True)
+        open(tracer.FLAG_FILE, "w").close()
+        return f"Startup will be traced into {tracer.TRACE_FILE}"
+    if mode == "off":
+        if os.path.exists(tracer.FLAG_FILE):
+            os.remove(tracer.FLAG_FILE)
+        return "Startup tracing disabled"
+
+    try:
+        with open(tracer.REPORT_FILE) as file:
+            return file.read()
+    except FileNotFoundError:
+        return "No startup trace recorded"
+
+
+@cm.command(name="startup-imports")
+def startup_imports(*args):
+    """
+    Lists modules imported at startup by import time if traced, see `startup-trace`,
+    and lazy modules imported since.
+    """
+    limit = int(args[0]) if args else 40
+    lines = [tracer.report(limit=limit, categories=["import"])]
+    if LazyModule.load_times:
+        lines.append("")
+        lines.append("Lazy imports:")
+        for name, seconds in sorted(LazyModule.load_times.items(), key=lambda t: t[1], reverse=True):
+            lines.append(f"{seconds * 1000:>7.1f} ms  {name}")
+    return "\n".join(lines)
+
+
+@cm.command(name="watchdog")
+def watchdog(*args):
+    """
+    ``on``/``off``: toggle the main loop stall detector.
+    """
+    mode = args[0] if args else "on"
+    if mode == "off":
+        MainLoopWatchdog.get_default().disable()
+        return "Watchdog disabled"
+    MainLoopWatchdog.get_default().enable()
+    return "Watchdog enabled, see `slow-handlers`"
+
+
+@cm.command(name="slow-handlers")
+def slow_handlers(*args):
+    n = int(args[0]) if args else 10
+    return MainLoopWatchdog.get_default().report(n)
+
+
+@cm.command(name="handler-profile")
+def handler_profile(*args):
+    """
+    ``on``/``off``: toggle profiling signal handlers, ``reset``: clear the profile,
+    ``export``: write the profile as TSV, ``report [n]``: show the top handlers.
+    """
+    mode = args[0] if args else "report"
+    match mode:
+        case "on":
+            HandlerMonitor.profiling = True
+            return "Profiling signal handlers"
+        case "off":
+            HandlerMonitor.profiling = False
+            return "Stopped profiling signal handlers"
+        case "reset":
+            HandlerMonitor.profile.clear()
+            return "Profile cleared"
+        case "export":
+            filename = os.path.join(CACHE_DIR, "handler-profile.tsv")
+            with open(filename, "w") as file:
+                file.write(HandlerMonitor.profile_table(sep="\t") + "\n")
+            return f"Profile written to {filename}"
+        case _:
+            return HandlerMonitor.profile_table(int(args[1]) if len(args) > 1 else 30)
+
+
+@cm.command(name="ticker-stats")
+def ticker_stats(*_):
+    return TickerService.get_default().report()
+
+
+@cm.command(name="launch-benchmark")
+def launch_benchmark(*args):
+    runs = int(args[0]) if args else 20
+    return benchmark_launch(runs)
+
+
+@cm.command(name="app-cache-stats")
+def app_cache_stats(*_):
+    return AppInfoCache.report()
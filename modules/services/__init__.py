@@ -1,5 +1,21 @@
 from .cpu import CpuLoadService
+from .dock import DockModel, WindowFocusHistory, WindowInfo
 from .fcitx import FcitxStateService
+from .frecency import FrecencyService
 from .keyboard import KeyboardLedsService
+from .ticker import TickerService
+from .watchdog import MainLoopWatchdog
+from .windowregistry import LazyWindowRegistry
 
-__all__ = [CpuLoadService, FcitxStateService, KeyboardLedsService]
+__all__ = [
+    CpuLoadService,
+    DockModel,
+    FcitxStateService,
+    FrecencyService,
+    KeyboardLedsService,
+    LazyWindowRegistry,
+    MainLoopWatchdog,
+    TickerService,
+    WindowFocusHistory,
+    WindowInfo,
+]
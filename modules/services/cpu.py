@@ -1,7 +1,8 @@
+from gi.repository import Gtk
 from ignis.base_service import BaseService
-from ignis.utils import Poll
 
 from ..utils import GProperty
+from .ticker import TickerService
 
 
 class CpuLoadService(BaseService):
@@ -11,7 +12,7 @@ class CpuLoadService(BaseService):
         self._idle_time: int = 0
         self._total_time: int = 0
         self.__cpu_times = self.__read_cpu_times()
-        self.__poll = Poll(timeout=1000, callback=self.__update_times)
+        self.__task = TickerService.get_default().add(1000, self.__update_times)
 
     @classmethod
     def __read_cpu_count(cls) -> int:
@@ -51,11 +52,17 @@ class CpuLoadService(BaseService):
         """
         sample interval in milliseconds
         """
-        return self.__poll.timeout
+        return self.__task.interval
 
     @interval.setter
     def interval(self, ms: int):
-        self.__poll.timeout = ms
+        self.__task.set_interval(ms)
+
+    def add_consumer(self, widget: Gtk.Widget):
+        """
+        Pauses sampling while ``widget`` and other consumers are all unmapped.
+        """
+        self.__task.add_consumer(widget)
 
     def __update_times(self, *_):
         """
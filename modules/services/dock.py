@@ -0,0 +1,358 @@
+import dataclasses
+from collections import OrderedDict
+from typing import Any, Iterator
+
+from ignis.base_service import BaseService
+from ignis.gobject import IgnisSignal
+from ignis.services.applications import Application, ApplicationsService
+from ignis.services.hyprland import HyprlandService, HyprlandWindow
+from ignis.services.niri import NiriService, NiriWindow
+
+from ..utils import FrameCoalescer, SpecsBase, get_app_id, hypr_commands, niri_actions
+
+
+class WindowInfo:
+    """
+    A wrapper to unify queries on ``NiriWindow`` and ``HyprlandWindow``.
+    """
+
+    def __init__(self, window: NiriWindow | HyprlandWindow):
+        self.window = window
+
+        self.id = 0
+        self.pid = window.pid
+        self.app_id = ""
+        self.workspace_id = window.workspace_id
+        self.title = window.title
+
+        if isinstance(window, NiriWindow):
+            self.id = window.id
+            self.app_id = window.app_id
+        else:
+            self.id = window.pid
+            self.app_id = window.class_name
+
+    @property
+    def key(self) -> tuple[int, int, str]:
+        """
+        Fields displayed in dock items, used to find out changed windows.
+        """
+        return (self.id, self.pid, self.title)
+
+    def __niri_focus(self) -> list[tuple[str, Any]]:
+        return [("FocusWindow", {"id": self.window.id})]
+
+    def __hypr_focus(self) -> list[str]:
+        return [f"dispatch focuswindow pid:{self.window.pid}", "dispatch alterzorder top"]
+
+    def focus(self):
+        if isinstance(self.window, NiriWindow):
+            niri_actions(self.__niri_focus())
+        elif isinstance(self.window, HyprlandWindow):
+            hypr_commands(self.__hypr_focus())
+
+    def maximize(self):
+        if isinstance(self.window, NiriWindow):
+            maximize = [] if self.window.is_floating else [("MaximizeColumn", {})]
+            niri_actions(self.__niri_focus() + maximize)
+        elif isinstance(self.window, HyprlandWindow):
+            hypr_commands(self.__hypr_focus() + ["dispatch fullscreen 1"])
+
+    def fullscreen(self):
+        if isinstance(self.window, NiriWindow):
+            niri_actions(self.__niri_focus() + [("FullscreenWindow", {"id": self.window.id})])
+        elif isinstance(self.window, HyprlandWindow):
+            hypr_commands(self.__hypr_focus() + ["dispatch fullscreen 0"])
+
+    def toggle_floating(self):
+        if isinstance(self.window, NiriWindow):
+            niri_actions(self.__niri_focus() + [("ToggleWindowFloating", {"id": self.window.id})])
+        elif isinstance(self.window, HyprlandWindow):
+            hypr_commands(self.__hypr_focus() + [f"dispatch togglefloating pid:{self.window.pid}"])
+
+    def close(self):
+        self.close_all([self])
+
+    @staticmethod
+    def close_all(windows: "list[WindowInfo]"):
+        """
+        Closes ``windows``, in a single batch on Hyprland.
+        """
+        niri_actions([("CloseWindow", {"id": w.window.id}) for w in windows if isinstance(w.window, NiriWindow)])
+        hypr_commands(
+            [f"dispatch closewindow pid:{w.window.pid}" for w in windows if isinstance(w.window, HyprlandWindow)]
+        )
+
+
+class WindowFocusHistory:
+    """
+    Manages windows focus history in most-recently-used order.
+
+    ``focus_hist`` keeps every known window, and ``app_hist`` keeps the windows of each app,
+    both ordered from the least to the most recently focused,
+    so focusing a window and querying the latest window of an app are both O(1).
+    Windows which are no longer open are pruned by ``sync_windows``.
+    """
+
+    initialized: bool = False
+    focused_window_id: int = 0
+    # OrderedDict[win_id, app_id]
+    focus_hist: OrderedDict[int, str] = OrderedDict()
+    # dict[app_id, OrderedDict[win_id, None]]
+    app_hist: dict[str, OrderedDict[int, None]] = {}
+
+    @classmethod
+    def focus_window(cls, window_id: int, app_id: str = ""):
+        """
+        Updates the current focused window id.
+        """
+        if cls.focused_window_id == window_id:
+            return
+
+        cls.focused_window_id = window_id
+        app_id = get_app_id(app_id)
+        previous = cls.focus_hist.get(window_id)
+        if previous is not None and previous != app_id:
+            cls.__forget_app_window(previous, window_id)
+
+        cls.focus_hist[window_id] = app_id
+        cls.focus_hist.move_to_end(window_id)
+        app_windows = cls.app_hist.setdefault(app_id, OrderedDict())
+        app_windows[window_id] = None
+        app_windows.move_to_end(window_id)
+
+    @classmethod
+    def recent(cls, app_id: str | None = None) -> Iterator[int]:
+        """
+        Iterates over window ids, from the most to the least recently focused.
+        Only windows of app ``app_id`` are yielded if set.
+        """
+        if app_id is None:
+            return reversed(cls.focus_hist)
+        return reversed(cls.app_hist.get(get_app_id(app_id), OrderedDict()))
+
+    @classmethod
+    def find_latest_index(cls, windows: list[WindowInfo] | None = None):
+        """
+        Finds the index of the latest focused window in ``windows``,
+        which are windows of the same app.
+        Returns ``-1`` if not found.
+        """
+        if not windows:
+            return -1
+
+        indexes = {win.id: i for i, win in enumerate(windows)}
+        for id in cls.recent(windows[0].app_id):
+            idx = indexes.get(id)
+            if idx is not None:
+                return idx
+        return -1
+
+    @classmethod
+    def sync_windows(cls, windows: list[WindowInfo] | None = None):
+        """
+        Prunes closed windows from the history.
+        On the first call, open windows are added in the order of their ids.
+        """
+        if not cls.initialized:
+            cls.initialized = True
+            for win in sorted(windows or [], key=lambda w: w.id):
+                cls.focus_window(win.id, win.app_id)
+            return
+
+        id_set = set(w.id for w in windows or [])
+        for id in [id for id in cls.focus_hist if id not in id_set]:
+            cls.__forget_app_window(cls.focus_hist.pop(id), id)
+
+    @classmethod
+    def __forget_app_window(cls, app_id: str, window_id: int):
+        app_windows = cls.app_hist.get(app_id)
+        if app_windows is not None:
+            app_windows.pop(window_id, None)
+            if not app_windows:
+                cls.app_hist.pop(app_id)
+
+
+class DockModel(BaseService, SpecsBase):
+    """
+    Windows and pinned apps shared by all the docks.
+
+    Windows are grouped by app id once per burst of compositor events,
+    and each dock reads its own filtered copy via ``get_view``.
+    Compositor signals are only connected while at least one dock holds the model,
+    see ``acquire`` and ``release``.
+    """
+
+    @dataclasses.dataclass
+    class View:
+        app_windows: dict[str, list[WindowInfo]]
+        """Maps ``app_id`` to windows sorted by id."""
+        pinned: set[str]
+        """App ids of pinned apps."""
+        app_dict: dict[str, Application]
+        """Maps ``app_id`` to ``Application``."""
+
+    def __init__(self):
+        self.__apps = ApplicationsService.get_default()
+        self.__niri = NiriService.get_default()
+        self.__hypr = HyprlandService.get_default()
+        super().__init__()
+        SpecsBase.__init__(self)
+
+        self.__refcount: int = 0
+        self.__app_windows: dict[str, list[WindowInfo]] = {}
+        self.__pinned: set[str] = set()
+        self.__app_dict: dict[str, Application] | None = None
+        self.__ws_output: dict[int, str | None] = {}
+        """Maps workspace id to monitor connector/name."""
+        self.__active_ws: set[int] = set()
+        """Focused workspace ids in any monitors."""
+        self.__views: dict[tuple[str | None, bool, bool], DockModel.View] = {}
+
+        self.__dirty_pinned: bool = False
+        self.__dirty_workspaces: bool = False
+        self.__dirty_windows: bool = False
+        self.__coalescer = FrameCoalescer(self.__apply_changes, name="DockModel")
+
+    @IgnisSignal
+    def changed(self):
+        """
+        Emitted once the model is updated, views should be queried again.
+        """
+
+    def acquire(self):
+        """
+        Holds a reference to the model, connecting to compositors on the first one.
+        """
+        self.__refcount += 1
+        if self.__refcount == 1:
+            self.__connect_services()
+
+    def release(self):
+        """
+        Drops a reference to the model, disconnecting from compositors on the last one.
+        """
+        if self.__refcount == 0:
+            return
+
+        self.__refcount -= 1
+        if self.__refcount == 0:
+            self.clear_specs()
+
+    def get_view(self, connector: str | None, monitor_only: bool = False, workspace_only: bool = False) -> View:
+        """
+        Returns windows in monitor ``connector``, cached until the model changes.
+        """
+        key = (connector, monitor_only, workspace_only)
+        view = self.__views.get(key)
+        if view is not None:
+            return view
+
+        if self.__app_dict is None:
+            self.__app_dict = {get_app_id(app.id): app for app in self.__apps.apps if app.id}
+
+        app_windows = self.__app_windows
+        if monitor_only or workspace_only:
+            ws_set = {id for id, output in self.__ws_output.items() if output == connector}
+            if not monitor_only:
+                ws_set &= self.__active_ws
+            app_windows = {}
+            for app_id, windows in self.__app_windows.items():
+                windows = [win for win in windows if win.workspace_id in ws_set]
+                if windows:
+                    app_windows[app_id] = windows
+
+        view = self.View(app_windows=app_windows, pinned=self.__pinned, app_dict=self.__app_dict)
+        self.__views[key] = view
+        return view
+
+    def __connect_services(self):
+        self.signal(self.__apps, "notify::apps", self.__on_apps_changed)
+        self.signal(self.__apps, "notify::pinned", self.__on_pinned_changed)
+        if self.__niri.is_available:
+            WindowFocusHistory.sync_windows([WindowInfo(w) for w in self.__niri.windows])
+            self.signal(self.__niri, "notify::workspaces", self.__on_workspaces_changed)
+            self.signal(self.__niri, "notify::windows", self.__on_windows_changed)
+            self.signal(self.__niri, "notify::active-window", self.__on_active_window_changed)
+        if self.__hypr.is_available:
+            WindowFocusHistory.sync_windows([WindowInfo(w) for w in self.__hypr.windows])
+            self.signal(self.__hypr, "notify::workspaces", self.__on_workspaces_changed)
+            self.signal(self.__hypr, "notify::windows", self.__on_windows_changed)
+            self.signal(self.__hypr, "notify::active-window", self.__on_active_window_changed)
+            for monitor in self.__hypr.monitors:
+                self.signal(monitor, "notify::active-workspace-id", self.__on_workspaces_changed)
+
+        self.__app_dict = None
+        self.__update_pinned()
+        self.__update_workspaces()
+        self.__update_windows()
+        self.__emit_changed()
+
+    def __emit_changed(self):
+        self.__views.clear()
+        self.emit("changed")
+
+    def __update_pinned(self):
+        self.__pinned = {get_app_id(app.id) for app in self.__apps.pinned if app.id}
+
+    def __update_workspaces(self):
+        if self.__niri.is_available:
+            self.__ws_output = {ws.id: ws.output for ws in self.__niri.workspaces}
+            self.__active_ws = set(ws.id for ws in self.__niri.workspaces if ws.is_active)
+        elif self.__hypr.is_available:
+            self.__ws_output = {ws.id: ws.monitor for ws in self.__hypr.workspaces}
+            self.__active_ws = set(m.active_workspace_id for m in self.__hypr.monitors)
+
+    def __update_windows(self):
+        if self.__niri.is_available:
+            windows = [WindowInfo(win) for win in self.__niri.windows]
+        elif self.__hypr.is_available:
+            windows = [WindowInfo(win) for win in self.__hypr.windows]
+        else:
+            windows = []
+
+        app_windows: dict[str, list[WindowInfo]] = {}
+        for window in sorted(windows, key=lambda w: w.id):
+            app_windows.setdefault(get_app_id(window.app_id), []).append(window)
+        self.__app_windows = app_windows
+        WindowFocusHistory.sync_windows(windows)
+
+    def __apply_changes(self):
+        if self.__refcount == 0:
+            return
+
+        if self.__dirty_pinned:
+            self.__dirty_pinned = False
+            self.__update_pinned()
+        if self.__dirty_workspaces:
+            self.__dirty_workspaces = False
+            self.__update_workspaces()
+        if self.__dirty_windows:
+            self.__dirty_windows = False
+            self.__update_windows()
+        self.__emit_changed()
+
+    def __on_apps_changed(self, *_):
+        self.__app_dict = None
+        self.__coalescer()
+
+    def __on_pinned_changed(self, *_):
+        self.__dirty_pinned = True
+        self.__coalescer()
+
+    def __on_workspaces_changed(self, *_):
+        self.__dirty_workspaces = True
+        self.__coalescer()
+
+    def __on_windows_changed(self, *_):
+        self.__dirty_windows = True
+        self.__coalescer()
+
+    def __on_active_window_changed(self, *_):
+        if self.__niri.is_available:
+            window = self.__niri.active_window
+            WindowFocusHistory.focus_window(window.id, window.app_id)
+        elif self.__hypr.is_available:
+            window = self.__hypr.active_window
+            WindowFocusHistory.focus_window(window.pid, window.class_name)
+        self.__coalescer()
@@ -0,0 +1,115 @@
+import json
+import math
+import os
+import time
+
+from ignis import DATA_DIR
+from ignis.app import IgnisApp
+from ignis.base_service import BaseService
+from ignis.utils import Timeout
+from loguru import logger
+
+
+class FrecencyService(BaseService):
+    """
+    Remembers how frequently and recently applications are launched.
+
+    Each app id keeps a score which is increased by one on every launch,
+    and halved every ``HALF_LIFE`` seconds since the last launch.
+    Scores are loaded on first use, and written to disk in batches.
+    """
+
+    FILE = os.path.join(DATA_DIR, "frecency.json")
+    HALF_LIFE = 7 * 24 * 3600
+    WRITE_DELAY = 5000
+    """Delay in milliseconds before writing launches to disk."""
+    MIN_SCORE = 0.01
+    """Scores decayed below it are dropped on write."""
+
+    def __init__(self):
+        super().__init__()
+        # dict[app_id, (score, timestamp)]
+        self.__entries: dict[str, tuple[float, float]] | None = None
+        self.__defer_write: Timeout | None = None
+        self.__dirty: bool = False
+
+        IgnisApp.get_initialized().connect("shutdown", lambda *_: self.flush())
+
+    @property
+    def entries(self) -> dict[str, tuple[float, float]]:
+        if self.__entries is None:
+            self.__entries = self.__load()
+        return self.__entries
+
+    def __load(self) -> dict[str, tuple[float, float]]:
+        try:
+            with open(self.FILE) as file:
+                data = json.load(file)
+            if not isinstance(data, dict):
+                raise TypeError(f"expected an object, got {type(data).__name__}")
+            return {str(app_id): (float(score), float(ts)) for app_id, (score, ts) in data.items()}
+        except FileNotFoundError:
+            return {}
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Failed to load frecency data: {e}")
+            return {}
+
+    def score(self, app_id: str | None, now: float | None = None) -> float:
+        """
+        Returns the decayed score of ``app_id``, ``0`` if never launched.
+        """
+        entry = app_id and self.entries.get(app_id)
+        if not entry:
+            return 0
+        score, ts = entry
+        now = now or time.time()
+        return score * math.pow(0.5, max(now - ts, 0) / self.HALF_LIFE)
+
+    def scores(self) -> dict[str, float]:
+        """
+        Returns decayed scores of all launched apps, a copy which is safe to read from other threads.
+        """
+        now = time.time()
+        return {app_id: self.score(app_id, now) for app_id in self.entries}
+
+    def record(self, app_id: str | None):
+        """
+        Records a launch of ``app_id``.
+        """
+        if not app_id:
+            return
+
+        now = time.time()
+        self.entries[app_id] = (self.score(app_id, now) + 1, now)
+        self.__dirty = True
+        if not self.__defer_write:
+            self.__defer_write = Timeout(ms=self.WRITE_DELAY, target=self.__on_write_timeout)
+
+    def __on_write_timeout(self, *_):
+        self.__defer_write = None
+        self.flush()
+
+    def flush(self):
+        """
+        Writes pending launches to disk.
+        """
+        if self.__defer_write:
+            self.__defer_write.cancel()
+            self.__defer_write = None
+        if self.__entries is None or not self.__dirty:
+            return
+
+        self.__dirty = False
+        now = time.time()
+        data = {
+            app_id: [round(score, 4), round(ts)]
+            for app_id, (score, ts) in self.__entries.items()
+            if self.score(app_id, now) >= self.MIN_SCORE
+        }
+        try:
+            os.makedirs(os.path.dirname(self.FILE), exist_ok=True)
+            with open(self.FILE + ".tmp", "w") as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.replace(self.FILE + ".tmp", self.FILE)
+        except OSError as e:
+            logger.warning(f"Failed to write frecency data: {e}")
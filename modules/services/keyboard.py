@@ -6,36 +6,23 @@ from ignis.base_service import BaseService
 from ignis.utils import thread
 from loguru import logger
 
-from ..utils import GProperty
+from ..utils import GProperty, LazyModule
 
-try:
-    import libevdev
-
-    del libevdev
-    libevdev_available = True
-except ModuleNotFoundError:
-    libevdev_available = False
+libevdev = LazyModule("libevdev")
 
 
 class KeyboardLedsService(BaseService):
     DEV_PATH = "/dev/input"
 
-    if libevdev_available:
-        import libevdev
-
-        EV_LED = libevdev.EV_LED  # type: ignore
-        LED_NUML = libevdev.EV_LED.LED_NUML  # type: ignore
-        LED_CAPSL = libevdev.EV_LED.LED_CAPSL  # type: ignore
-        LED_SCROLLL = libevdev.EV_LED.LED_SCROLLL  # type: ignore
-    else:
-        EV_LED = None
-        LED_NUML = None
-        LED_CAPSL = None
-        LED_SCROLLL = None
-
     def __init__(self):
         super().__init__()
 
+        # set once libevdev is loaded
+        self.EV_LED: Any = None
+        self.LED_NUML: Any = None
+        self.LED_CAPSL: Any = None
+        self.LED_SCROLLL: Any = None
+
         self._numlock: bool | None = None
         self._capslock: bool | None = None
         self._scrolllock: bool | None = None
@@ -55,10 +42,14 @@ class KeyboardLedsService(BaseService):
         return self._scrolllock
 
     def __sync_devices(self):
-        if not libevdev_available:
+        if not libevdev.available:
             logger.warning("Install `libevdev` to display capslock state in OSD")
             return
-        import libevdev
+
+        self.EV_LED = libevdev.EV_LED
+        self.LED_NUML = libevdev.EV_LED.LED_NUML
+        self.LED_CAPSL = libevdev.EV_LED.LED_CAPSL
+        self.LED_SCROLLL = libevdev.EV_LED.LED_SCROLLL
 
         for file in os.listdir(self.DEV_PATH):
             if not file.startswith("event"):
@@ -73,24 +64,17 @@ class KeyboardLedsService(BaseService):
                 logger.warning("User should be a member of the `input` group to display capslock state in OSD")
                 break
 
-    @classmethod
-    def __device_support_leds(cls, d: Any) -> bool:
-        import libevdev
-
-        device: libevdev.Device = d
-        if not device.has(cls.EV_LED):
+    def __device_support_leds(self, device: Any) -> bool:
+        if not device.has(self.EV_LED):
             return False
 
-        for led in [cls.LED_NUML, cls.LED_CAPSL, cls.LED_SCROLLL]:
+        for led in [self.LED_NUML, self.LED_CAPSL, self.LED_SCROLLL]:
             if device.has(led):
                 return True
 
         return False
 
-    def __listen_to_events(self, d: Any):
-        import libevdev
-
-        device: libevdev.Device = d
+    def __listen_to_events(self, device: Any):
         try:
             while True:
                 for event in device.events():
@@ -0,0 +1,228 @@
+import math
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable
+
+from gi.repository import GLib, Gtk
+from ignis.base_service import BaseService
+
+from ..utils import is_instance_method, unpack_instance_method
+
+
+class TickerService(BaseService):
+    """
+    Runs periodic tasks from a single timer, replacing one ``Poll`` per widget.
+
+    Tasks are grouped by interval, and each group fires at multiples of its interval on the wall clock,
+    e.g. a task of 60 seconds runs on minute boundaries,
+    so groups of compatible intervals share the same wakeups.
+    A task with consumer widgets is suspended while none of them is mapped,
+    and runs right away when one is mapped again if it missed a tick.
+    """
+
+    SLACK = 5
+    """Groups due within it in milliseconds run in the same wakeup."""
+
+    class Task:
+        def __init__(self, ticker: "TickerService", interval: int, callback: Callable[[], Any]):
+            if is_instance_method(callback):
+                obj, func = unpack_instance_method(callback)
+                ref_obj = weakref.ref(obj)
+
+                def weak_callback():
+                    obj = ref_obj()
+                    if obj:
+                        func(obj)
+                    else:
+                        self.cancel()
+
+                self.__callback = weak_callback
+            else:
+                self.__callback = callback
+            self.__ticker = ticker
+            self.__consumers: list[weakref.ref[Gtk.Widget]] = []
+            # list[(consumer, map handler id, unmap handler id)]
+            self.__handlers: list[tuple[weakref.ref[Gtk.Widget], int, int]] = []
+            self.__last_run: float = 0
+            self.name: str = getattr(callback, "__qualname__", repr(callback))
+            self.interval: int = interval
+            self.cancelled: bool = False
+
+        @property
+        def active(self) -> bool:
+            """
+            Whether the task runs on ticks, i.e. it has no consumers or any of them is mapped.
+            """
+            if self.cancelled:
+                return False
+            if not self.__consumers:
+                return True
+            return any(c() is not None and c().get_mapped() for c in self.__consumers)  # type: ignore
+
+        def add_consumer(self, widget: Gtk.Widget):
+            """
+            Suspends the task while ``widget`` and other consumers are all unmapped.
+            The task is cancelled once all consumers are destroyed.
+            """
+            self.__consumers.append(weakref.ref(widget, self.__on_consumer_lost))
+            map_id = widget.connect("map", self.__on_consumer_mapped)
+            unmap_id = widget.connect("unmap", self.__on_consumer_unmapped)
+            self.__handlers.append((weakref.ref(widget), map_id, unmap_id))
+            self.__ticker.reschedule()
+
+        def set_interval(self, interval: int):
+            self.__ticker.move(self, interval)
+
+        def run(self):
+            self.__last_run = TickerService.now()
+            self.__callback()
+
+        @property
+        def missed(self) -> bool:
+            """
+            Whether a tick passed since the task last ran.
+            """
+            return TickerService.next_deadline(self.interval, self.__last_run) <= TickerService.now()
+
+        def cancel(self):
+            if not self.cancelled:
+                self.cancelled = True
+                self.__ticker.remove(self)
+                for ref, map_id, unmap_id in self.__handlers:
+                    widget = ref()
+                    if widget is not None:
+                        widget.disconnect(map_id)
+                        widget.disconnect(unmap_id)
+                self.__handlers.clear()
+
+        def __on_consumer_lost(self, *_):
+            self.__consumers = [c for c in self.__consumers if c() is not None]
+            if not self.__consumers:
+                self.cancel()
+
+        def __on_consumer_mapped(self, *_):
+            if self.missed and not self.cancelled:
+                self.run()
+            self.__ticker.reschedule()
+
+        def __on_consumer_unmapped(self, *_):
+            self.__ticker.reschedule()
+
+    def __init__(self):
+        super().__init__()
+        # dict[interval, (next deadline in wall clock milliseconds, tasks)]
+        self.__groups: dict[int, tuple[float, list[TickerService.Task]]] = {}
+        self.__source_id: int = 0
+        self.__deadline: float = 0
+        self.wakeups: deque[float] = deque(maxlen=1024)
+        """Monotonic times of recent wakeups in seconds."""
+
+    @staticmethod
+    def now() -> float:
+        """
+        Wall clock time in milliseconds.
+        """
+        return time.time() * 1000
+
+    @staticmethod
+    def next_deadline(interval: int, now: float) -> float:
+        return (math.floor(now / interval) + 1) * interval
+
+    def add(
+        self, interval: int, callback: Callable[[], Any], widget: Gtk.Widget | None = None, immediate: bool = True
+    ) -> "TickerService.Task":
+        """
+        Runs ``callback`` every ``interval`` milliseconds, aligned to the wall clock.
+
+        Args:
+            callback: Invoked without arguments. Instance methods are referenced weakly.
+            widget: A consumer, see ``Task.add_consumer``.
+            immediate: Whether to run ``callback`` right away.
+        """
+        task = self.Task(self, interval, callback)
+        self.__insert(task)
+        if widget:
+            task.add_consumer(widget)
+        if immediate:
+            task.run()
+        self.reschedule()
+        return task
+
+    def __insert(self, task: "TickerService.Task"):
+        interval = task.interval
+        if interval not in self.__groups:
+            self.__groups[interval] = (self.next_deadline(interval, self.now()), [])
+        self.__groups[interval][1].append(task)
+
+    def remove(self, task: "TickerService.Task"):
+        group = self.__groups.get(task.interval)
+        if group and task in group[1]:
+            group[1].remove(task)
+            if not group[1]:
+                del self.__groups[task.interval]
+        self.reschedule()
+
+    def move(self, task: "TickerService.Task", interval: int):
+        self.remove(task)
+        task.interval = interval
+        self.__insert(task)
+        self.reschedule()
+
+    def reschedule(self):
+        """
+        Arms the timer for the earliest group with active tasks, or removes it if there is none.
+        """
+        now = self.now()
+        deadlines: list[float] = []
+        for interval, (deadline, tasks) in self.__groups.items():
+            if not any(t.active for t in tasks):
+                continue
+            if deadline < now - self.SLACK:
+                # the group was suspended, its tasks run on consumers mapped
+                deadline = self.next_deadline(interval, now)
+                self.__groups[interval] = (deadline, tasks)
+            deadlines.append(deadline)
+        deadline = min(deadlines) if deadlines else 0
+        if self.__source_id and deadline == self.__deadline:
+            return
+
+        if self.__source_id:
+            GLib.source_remove(self.__source_id)
+            self.__source_id = 0
+        self.__deadline = deadline
+        if deadline:
+            delay = max(0, math.ceil(deadline - now))
+            self.__source_id = GLib.timeout_add(delay, self.__on_wakeup)
+
+    def __on_wakeup(self) -> bool:
+        self.__source_id = 0
+        self.wakeups.append(time.monotonic())
+
+        now = self.now()
+        for interval, (deadline, tasks) in list(self.__groups.items()):
+            if deadline > now + self.SLACK:
+                continue
+            self.__groups[interval] = (self.next_deadline(interval, now + self.SLACK), tasks)
+            for task in list(tasks):
+                if task.active:
+                    task.run()
+
+        self.reschedule()
+        return GLib.SOURCE_REMOVE
+
+    def wakeups_per_minute(self) -> int:
+        since = time.monotonic() - 60
+        return sum(1 for t in self.wakeups if t >= since)
+
+    def report(self) -> str:
+        """
+        Formats wakeups in the last minute, and tasks grouped by interval.
+        """
+        lines = [f"Wakeups in the last minute: {self.wakeups_per_minute()}", ""]
+        lines.append(f"{'interval':>10} {'active':>7} {'tasks':>6}  names")
+        for interval, (_, tasks) in sorted(self.__groups.items()):
+            active = sum(1 for t in tasks if t.active)
+            names = ", ".join(sorted(set(t.name for t in tasks)))
+            lines.append(f"{interval:>7} ms {active:>7} {len(tasks):>6}  {names}")
+        return "\n".join(lines)
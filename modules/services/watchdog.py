@@ -0,0 +1,149 @@
+import time
+import weakref
+from collections import deque
+
+from gi.repository import Gdk, Gio, GLib, Gtk
+from ignis.base_service import BaseService
+from loguru import logger
+
+from ..utils import HandlerMonitor
+
+
+class MainLoopWatchdog(BaseService):
+    """
+    Detects stalls of the GTK main loop.
+
+    A heartbeat at high priority measures how late each main loop iteration runs,
+    and frame clocks of toplevel windows measure how long each frame takes from before-paint to after-paint,
+    i.e. updating, layout and painting. Idle time between frames is not counted,
+    as the frame clock only ticks when a redraw is requested.
+    Each stall is attributed to the slowest handler recorded by ``HandlerMonitor`` meanwhile.
+    """
+
+    INTERVAL = 100
+    """Heartbeat interval in milliseconds."""
+    STALL_MS = 50
+    """Minimum lateness of a heartbeat, or duration of a frame, recorded as a stall."""
+
+    def __init__(self):
+        super().__init__()
+        self.__heartbeat_id: int = 0
+        self.__last_beat: float = 0
+        self.stalls: deque[tuple[float, str, float, str]] = deque(maxlen=128)
+        """Recent stalls as ``(time, kind, duration, blamed handler)``, times in seconds."""
+        self.frames: int = 0
+        self.slow_frames: int = 0
+        self.__watched: weakref.WeakSet[Gtk.Widget] = weakref.WeakSet()
+        self.__toplevels: Gio.ListModel = Gtk.Window.get_toplevels()
+        self.__toplevels_id: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.__heartbeat_id != 0
+
+    def enable(self):
+        if self.enabled:
+            return
+
+        HandlerMonitor.enabled = True
+        self.__last_beat = time.perf_counter()
+        self.__heartbeat_id = GLib.timeout_add(self.INTERVAL, self.__on_heartbeat, priority=GLib.PRIORITY_HIGH)
+        # also watch windows built afterwards, e.g. those built lazily by ``LazyWindowRegistry``
+        self.__toplevels_id = self.__toplevels.connect("items-changed", self.__on_toplevels_changed)
+        for window in Gtk.Window.list_toplevels():
+            self.watch_frame_clock(window)
+
+    def disable(self):
+        if not self.enabled:
+            return
+
+        HandlerMonitor.enabled = False
+        GLib.source_remove(self.__heartbeat_id)
+        self.__heartbeat_id = 0
+        self.__toplevels.disconnect(self.__toplevels_id)
+        self.__toplevels_id = 0
+
+    def __on_toplevels_changed(self, model: Gio.ListModel, position: int, removed: int, added: int):
+        for i in range(position, position + added):
+            window = model.get_item(i)
+            if isinstance(window, Gtk.Widget):
+                self.watch_frame_clock(window)
+
+    def watch_frame_clock(self, widget: Gtk.Widget):
+        """
+        Records frames of ``widget`` taking long from before-paint to after-paint, whenever it is realized.
+        """
+        if widget in self.__watched:
+            return
+        self.__watched.add(widget)
+
+        frame_start = [0.0]
+        # the clock connected and its handler ids
+        connected: list[tuple[Gdk.FrameClock, int, int]] = []
+
+        def on_before_paint(clock: Gdk.FrameClock):
+            if self.enabled:
+                frame_start[0] = time.perf_counter()
+
+        def on_after_paint(clock: Gdk.FrameClock):
+            if not self.enabled or not frame_start[0]:
+                return
+
+            self.frames += 1
+            duration = time.perf_counter() - frame_start[0]
+            frame_start[0] = 0
+            if duration * 1000 >= self.STALL_MS:
+                self.slow_frames += 1
+                self.__record("frame", duration, time.perf_counter() - duration)
+
+        def on_realize(widget: Gtk.Widget):
+            clock = widget.get_frame_clock()
+            if connected and connected[0][0] == clock:
+                return
+            if connected:
+                previous, before_id, after_id = connected.pop()
+                previous.disconnect(before_id)
+                previous.disconnect(after_id)
+            if clock:
+                before_id = clock.connect("before-paint", on_before_paint)
+                after_id = clock.connect("after-paint", on_after_paint)
+                connected.append((clock, before_id, after_id))
+
+        # a window gets a new frame clock every time it is realized again, e.g. shown after hidden
+        widget.connect("realize", on_realize)
+        if widget.get_realized():
+            on_realize(widget)
+
+    def __on_heartbeat(self) -> bool:
+        now = time.perf_counter()
+        late = now - self.__last_beat - self.INTERVAL / 1000
+        if late * 1000 >= self.STALL_MS:
+            self.__record("loop", late, self.__last_beat)
+        self.__last_beat = now
+        return GLib.SOURCE_CONTINUE
+
+    def __record(self, kind: str, duration: float, since: float):
+        slowest = HandlerMonitor.slowest_since(since)
+        blamed = f"{slowest[0]} ({slowest[1] * 1000:.0f} ms)" if slowest else "unattributed"
+        self.stalls.append((time.time(), kind, duration, blamed))
+        logger.debug(f"Main loop stalled ({kind}) for {duration * 1000:.0f} ms, blamed on {blamed}")
+
+    def report(self, n: int = 10) -> str:
+        """
+        Formats the top ``n`` slow handlers and recent stalls.
+        """
+        if not self.enabled:
+            return "Watchdog is disabled, run `watchdog on` first"
+
+        lines = [f"Slow handlers (>= {HandlerMonitor.SLOW_MS} ms):"]
+        lines.append(f"{'count':>6} {'total':>10} {'max':>10}  handler")
+        for label, count, total, peak in HandlerMonitor.top(n):
+            lines.append(f"{count:>6} {total * 1000:>7.0f} ms {peak * 1000:>7.0f} ms  {label}")
+
+        lines.append("")
+        lines.append(f"Frames: {self.frames}, slow: {self.slow_frames}")
+        lines.append("Recent stalls:")
+        for ts, kind, duration, blamed in list(self.stalls)[-n:]:
+            clock = time.strftime("%H:%M:%S", time.localtime(ts))
+            lines.append(f"{clock} {kind:<5} {duration * 1000:>6.0f} ms  {blamed}")
+        return "\n".join(lines)
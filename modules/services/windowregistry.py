@@ -0,0 +1,157 @@
+import time
+from collections import deque
+from typing import Callable
+
+from gi.repository import GLib, Gtk
+from ignis.base_service import BaseService
+from ignis.exceptions import WindowNotFoundError
+from ignis.window_manager import WindowManager
+from loguru import logger
+
+from ..tracer import tracer
+
+
+class LazyWindowRegistry(BaseService):
+    """
+    Defers constructing windows until they are first requested.
+
+    A window is registered by its namespace with a factory, and built on the first ``get_window``,
+    ``open_window`` or ``toggle_window`` of the registry. Closing a window not built yet does nothing.
+    Windows which react to events, e.g. popups, should be registered with ``prebuild``,
+    so they are built one by one when the main loop is idle after startup.
+
+    So that ``ignis toggle-window`` and ``ignis open-window`` build windows on demand as well,
+    ``get_window`` and ``close_window`` of the ``WindowManager`` instance are replaced by lazy versions,
+    relying on ``toggle_window`` and ``open_window`` of ignis looking windows up by ``get_window``.
+    The replacement is skipped with a warning if the ``WindowManager`` does not look as expected.
+    Note ``WindowManager.windows`` only lists windows built so far, see ``namespaces`` for all.
+    """
+
+    PRIORITY = GLib.PRIORITY_LOW
+    PATCHED_METHODS = ("get_window", "close_window", "open_window", "toggle_window")
+    """Methods of ``WindowManager`` which should exist, the first two are replaced."""
+
+    def __init__(self):
+        super().__init__()
+        self.__wm = WindowManager.get_default()
+        self.__factories: dict[str, Callable[[], Gtk.Window]] = {}
+        self.__prebuild: list[str] = []
+        self.__queue: deque[str] = deque()
+        self.__idle_id: int = 0
+        self.build_times: dict[str, float] = {}
+        """Time in seconds spent building each window."""
+
+        self.__get_window: Callable[[str], Gtk.Window] = self.__wm.get_window
+        self.__patch_window_manager()
+
+    def __patch_window_manager(self):
+        wm = self.__wm
+        if not all(callable(getattr(wm, name, None)) for name in self.PATCHED_METHODS):
+            logger.warning(
+                "WindowManager has no expected methods, "
+                "windows not built yet can't be opened by `ignis toggle-window` or `ignis open-window`"
+            )
+            return
+
+        get_window = self.__get_window
+        close_window = wm.close_window
+
+        def lazy_get_window(window_name: str) -> Gtk.Window:
+            if window_name in self.__factories:
+                return self.build(window_name)
+            return get_window(window_name)
+
+        def lazy_close_window(window_name: str):
+            if window_name in self.__factories and not self.is_built(window_name):
+                return
+            close_window(window_name)
+
+        wm.get_window = lazy_get_window
+        wm.close_window = lazy_close_window
+
+    @property
+    def namespaces(self) -> list[str]:
+        return list(self.__factories.keys())
+
+    def register(self, namespace: str, factory: Callable[[], Gtk.Window], prebuild: bool = False):
+        """
+        Registers a window to be built by ``factory`` on first use.
+        The window built should have ``namespace`` as its namespace.
+
+        Args:
+            prebuild: Whether the window is built in ``start_prebuild`` anyway.
+        """
+        self.__factories[namespace] = factory
+        if prebuild:
+            self.__prebuild.append(namespace)
+
+    def is_built(self, namespace: str) -> bool:
+        try:
+            self.__get_window(namespace)
+            return True
+        except WindowNotFoundError:
+            return False
+
+    def build(self, namespace: str) -> Gtk.Window:
+        """
+        Builds the window of ``namespace`` if not built yet.
+        """
+        try:
+            return self.__get_window(namespace)
+        except WindowNotFoundError:
+            pass
+
+        start = time.perf_counter()
+        with tracer.span(namespace, "window"):
+            window = self.__factories[namespace]()
+        self.build_times[namespace] = time.perf_counter() - start
+        logger.debug(f"Built window {namespace} in {self.build_times[namespace] * 1000:.1f} ms")
+        return window
+
+    def get_window(self, namespace: str) -> Gtk.Window:
+        """
+        Returns the window of ``namespace``, building it first if registered and not built yet.
+        Raises ``WindowNotFoundError`` for unknown namespaces.
+        """
+        if namespace in self.__factories:
+            return self.build(namespace)
+        return self.__get_window(namespace)
+
+    def open_window(self, namespace: str):
+        self.get_window(namespace).set_visible(True)
+
+    def close_window(self, namespace: str):
+        """
+        Hides the window of ``namespace``, doing nothing if it is registered but not built yet.
+        """
+        if namespace in self.__factories and not self.is_built(namespace):
+            return
+        self.__get_window(namespace).set_visible(False)
+
+    def toggle_window(self, namespace: str):
+        window = self.get_window(namespace)
+        window.set_visible(not window.get_visible())
+
+    def start_prebuild(self, everything: bool = False):
+        """
+        Builds windows registered with ``prebuild`` in idle time, one window per main loop iteration.
+
+        Args:
+            everything: Whether to build all registered windows, not only those with ``prebuild``.
+        """
+        self.__queue.extend(self.namespaces if everything else self.__prebuild)
+        if self.__queue and not self.__idle_id:
+            self.__idle_id = GLib.idle_add(self.__prebuild_step, priority=self.PRIORITY)
+
+    def __prebuild_step(self) -> bool:
+        while self.__queue:
+            namespace = self.__queue.popleft()
+            if not self.is_built(namespace):
+                self.build(namespace)
+                break
+
+        if self.__queue:
+            return GLib.SOURCE_CONTINUE
+
+        self.__idle_id = 0
+        return GLib.SOURCE_REMOVE
@@ -0,0 +1,273 @@
+import importlib.abc
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Iterator
+
+# same as `ignis.CACHE_DIR`, which is not imported here so that ignis itself can be traced
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "ignis")
+
+
+class StartupTracer:
+    """
+    Records a timeline of startup: imports, blueprint compiling, templates, services and windows.
+
+    Enabled if the environment variable ``IGNIS_SHELL_TRACE`` is set,
+    or the ``startup-trace on`` command was run before the last start or reload.
+    Stays disabled otherwise, when ``span`` is a no-op and imports are not hooked.
+    """
+
+    ENV = "IGNIS_SHELL_TRACE"
+    FLAG_FILE = os.path.join(CACHE_DIR, "startup-trace.flag")
+    REPORT_FILE = os.path.join(CACHE_DIR, "startup-trace.txt")
+    TRACE_FILE = os.path.join(CACHE_DIR, "startup-trace.json")
+    """Chrome trace, can be opened in ``chrome://tracing`` or Perfetto."""
+
+    @dataclass
+    class Span:
+        name: str
+        category: str
+        start: int
+        end: int = 0
+        depth: int = 0
+        tid: int = 0
+        children: int = 0
+        """Total time of direct children in nanoseconds."""
+
+        @property
+        def duration(self) -> int:
+            return self.end - self.start
+
+        @property
+        def self_time(self) -> int:
+            return self.duration - self.children
+
+    class ImportTracer(importlib.abc.MetaPathFinder):
+        """
+        Wraps loaders found by other finders, timing module execution.
+        The original loader is restored on the module once executed.
+        """
+
+        class Loader(importlib.abc.Loader):
+            def __init__(self, loader: Any, tracer: "StartupTracer"):
+                self.__loader = loader
+                self.__tracer = tracer
+
+            def __getattr__(self, name: str) -> Any:
+                return getattr(self.__loader, name)
+
+            def create_module(self, spec):
+                return self.__loader.create_module(spec)
+
+            def exec_module(self, module):
+                try:
+                    with self.__tracer.record(module.__name__, "import"):
+                        self.__loader.exec_module(module)
+                finally:
+                    if getattr(module, "__loader__", None) is self:
+                        module.__loader__ = self.__loader
+                    spec = getattr(module, "__spec__", None)
+                    if spec is not None and spec.loader is self:
+                        spec.loader = self.__loader
+
+        def __init__(self, tracer: "StartupTracer"):
+            self.__tracer = tracer
+            self.__finding = threading.local()
+
+        def find_spec(self, fullname, path, target=None):
+            if getattr(self.__finding, "active", False):
+                return None
+
+            self.__finding.active = True
+            try:
+                for finder in sys.meta_path:
+                    if finder is self or not hasattr(finder, "find_spec"):
+                        continue
+                    spec = finder.find_spec(fullname, path, target)
+                    if spec is not None:
+                        break
+                else:
+                    return None
+            finally:
+                self.__finding.active = False
+
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = self.Loader(spec.loader, self.__tracer)
+            return spec
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.spans: list[StartupTracer.Span] = []
+        self.__origin = time.perf_counter_ns()
+        self.__stacks = threading.local()
+        self.__import_tracer: StartupTracer.ImportTracer | None = None
+
+    def __stack(self) -> list["StartupTracer.Span"]:
+        if not hasattr(self.__stacks, "spans"):
+            self.__stacks.spans = []
+        return self.__stacks.spans
+
+    def enable_if_requested(self):
+        if os.environ.get(self.ENV) or os.path.exists(self.FLAG_FILE):
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+
+        self.enabled = True
+        self.track_imports()
+
+        from ignis.base_service import BaseService
+
+        self.trace_first_calls(BaseService, "get_default", "service")
+
+    def disable(self):
+        self.enabled = False
+        self.stop_tracking_imports()
+
+    def track_imports(self):
+        if self.__import_tracer is None:
+            self.__import_tracer = self.ImportTracer(self)
+            sys.meta_path.insert(0, self.__import_tracer)
+
+    def stop_tracking_imports(self):
+        if self.__import_tracer in sys.meta_path:
+            sys.meta_path.remove(self.__import_tracer)
+        self.__import_tracer = None
+
+    @contextmanager
+    def record(self, name: str, category: str) -> Iterator[None]:
+        """
+        Times the ``with`` block as a span of ``category``, even if tracing is disabled.
+        """
+        stack = self.__stack()
+        span = self.Span(
+            name=name, category=category, start=time.perf_counter_ns(), depth=len(stack), tid=threading.get_ident()
+        )
+        stack.append(span)
+        try:
+            yield
+        finally:
+            span.end = time.perf_counter_ns()
+            stack.pop()
+            if stack:
+                stack[-1].children += span.duration
+            self.spans.append(span)
+
+    def span(self, name: str, category: str) -> ContextManager[None]:
+        """
+        Times the ``with`` block as a span of ``category``.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self.record(name, category)
+
+    def trace_first_calls(self, owner: type, method_name: str, category: str):
+        """
+        Wraps the classmethod ``method_name`` of ``owner``,
+        timing its first call from each class, e.g. ``get_default`` of services.
+        """
+        static = inspect.getattr_static(owner, method_name)
+        if not isinstance(static, classmethod):
+            return
+        func: Callable = static.__func__
+        seen: set[type] = set()
+
+        def traced(cls, *args, **kwargs):
+            if not self.enabled or cls in seen:
+                return func(cls, *args, **kwargs)
+            seen.add(cls)
+            with self.span(f"{cls.__name__}.{method_name}", category):
+                return func(cls, *args, **kwargs)
+
+        setattr(owner, method_name, classmethod(traced))
+
+    def report(self, limit: int = 40, categories: list[str] | None = None) -> str:
+        """
+        Formats the slowest spans, with their self time excluding nested spans.
+
+        Args:
+            categories: Only include spans of these categories.
+        """
+        spans = [span for span in self.spans if categories is None or span.category in categories]
+        if not spans:
+            return "No startup trace recorded"
+
+        end = max(span.end for span in spans)
+        lines = [f"Traced for {(end - self.__origin) / 1e6:.1f} ms since startup", ""]
+
+        totals: dict[str, int] = {}
+        for span in spans:
+            if span.depth == 0:
+                totals[span.category] = totals.get(span.category, 0) + span.duration
+        lines.append("  ".join(f"{category}: {ns / 1e6:.1f} ms" for category, ns in totals.items()))
+        lines.append("")
+
+        lines.append(f"{'total':>10} {'self':>10}  {'category':<10} name")
+        for span in sorted(spans, key=lambda s: s.duration, reverse=True)[:limit]:
+            lines.append(
+                f"{span.duration / 1e6:>7.1f} ms {span.self_time / 1e6:>7.1f} ms  {span.category:<10} "
+                f"{'  ' * span.depth}{span.name}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start - self.__origin) / 1000,
+                    "dur": span.duration / 1000,
+                    "pid": pid,
+                    "tid": span.tid,
+                }
+                for span in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def finish_when_idle(self):
+        """
+        Removes the import hook, and dumps the trace if enabled,
+        once the main loop is idle, after windows built in idle time.
+        """
+        from gi.repository import GLib
+        from loguru import logger
+
+        def finish():
+            self.stop_tracking_imports()
+            if self.enabled:
+                logger.info(self.dump())
+            return GLib.SOURCE_REMOVE
+
+        GLib.idle_add(finish, priority=GLib.PRIORITY_LOW + 10)
+
+    def dump(self) -> str:
+        """
+        Writes the report and the Chrome trace to ``CACHE_DIR``, then disables tracing,
+        also for the next start as ``startup-trace on`` only applies to one start.
+        Returns the report.
+        """
+        self.disable()
+        if os.path.exists(self.FLAG_FILE):
+            os.remove(self.FLAG_FILE)
+        report = self.report()
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(self.REPORT_FILE, "w") as file:
+            file.write(report + "\n")
+        with open(self.TRACE_FILE, "w") as file:
+            json.dump(self.chrome_trace(), file)
+        return report
+
+
+tracer = StartupTracer()
+tracer.enable_if_requested()
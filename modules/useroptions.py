@@ -13,6 +13,8 @@ class UserOptions(OptionsManager):
         exclusive_focus: bool = True
         command_format: str = "%command%"
         terminal_format: str = "foot %command%"
+        prewarm: bool = False
+        search_debounce: int = 50
 
     class ActiveWindow(OptionsGroup):
         on_click: str = "niri msg action center-column"
@@ -40,6 +42,10 @@ class UserOptions(OptionsManager):
     class Osd(OptionsGroup):
         timeout: int = 3000
 
+    class Startup(OptionsGroup):
+        gresource_bundle: bool = False
+        prebuild_windows: bool = False
+
     class Topbar(OptionsGroup):
         exclusive: bool = True
         focusable: bool = False
@@ -56,6 +62,7 @@ class UserOptions(OptionsManager):
     fcitx_kimpanel = FcitxKimPanel()
     topbar = Topbar()
     osd = Osd()
+    startup = Startup()
     wallpaper = Wallpaper()
 
 
@@ -1,20 +1,38 @@
-from .desktop import app_icon_overrides, app_id_overrides, get_app_icon_name, get_app_id, launch_application
+from .desktop import (
+    AppInfoCache,
+    app_icon_overrides,
+    app_id_overrides,
+    benchmark_launch,
+    expand_exec,
+    get_app_icon_name,
+    get_app_id,
+    launch_application,
+    shell_command,
+    spawn_argv,
+)
+from .dispatch import parse_native_cmd, run_user_cmd
 from .gesture import set_on_click, set_on_key_pressed, set_on_motion, set_on_scroll
-from .hypr import hypr_command
+from .hypr import hypr_command, hypr_commands
+from .lazy import LazyModule
 from .misc import (
+    CommandRunner,
     b64enc,
     clear_dir,
     dbus_info_file,
     format_time_duration,
     is_instance_method,
     run_cmd_async,
+    status_cmd_runner,
     unpack_instance_method,
 )
-from .niri import niri_action
+from .niri import niri_action, niri_actions
 from .options import bind_option, connect_option
 from .pango import escape_pango_markup, verify_pango_markup
+from .search import AppSearchIndex, fuzzy_score
 from .signal import (
     BindingSpec,
+    FrameCoalescer,
+    HandlerMonitor,
     SignalSpec,
     SpecsBase,
     SpecType,
@@ -24,12 +42,28 @@ from .signal import (
     weak_connect_callback,
     weak_connect_method,
 )
-from .template import ensure_ui_file, gtk_template, gtk_template_callback, gtk_template_child
+from .resource import lookup_resource_text, resource_path
+from .template import (
+    ensure_resource_bundle,
+    ensure_ui_file,
+    gtk_template,
+    gtk_template_callback,
+    gtk_template_child,
+    new_builder,
+    prebuild_blueprints,
+)
+from .style import cached_sass_compile, scss_hash
 from .widget import GProperty, connect_window, get_widget_monitor, get_widget_monitor_id
 
 __all__ = [
+    AppInfoCache,
+    AppSearchIndex,
     BindingSpec,
+    CommandRunner,
+    FrameCoalescer,
     GProperty,
+    HandlerMonitor,
+    LazyModule,
     SignalSpec,
     SpecsBase,
     SpecType,
@@ -38,14 +72,19 @@ __all__ = [
     app_icon_overrides,
     app_id_overrides,
     b64enc,
+    benchmark_launch,
     bind_option,
+    cached_sass_compile,
     clear_dir,
     connect_option,
     connect_window,
     dbus_info_file,
+    ensure_resource_bundle,
     ensure_ui_file,
     escape_pango_markup,
+    expand_exec,
     format_time_duration,
+    fuzzy_score,
     get_app_icon_name,
     get_app_id,
     get_widget_monitor,
@@ -54,15 +93,27 @@ __all__ = [
     gtk_template_callback,
     gtk_template_child,
     hypr_command,
+    hypr_commands,
     is_instance_method,
     unpack_instance_method,
     launch_application,
+    lookup_resource_text,
+    new_builder,
     niri_action,
+    niri_actions,
+    parse_native_cmd,
+    prebuild_blueprints,
+    resource_path,
     run_cmd_async,
+    run_user_cmd,
+    scss_hash,
     set_on_click,
     set_on_key_pressed,
     set_on_motion,
     set_on_scroll,
+    shell_command,
+    spawn_argv,
+    status_cmd_runner,
     verify_pango_markup,
     weak_connect,
     weak_connect_callback,
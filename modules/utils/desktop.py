@@ -1,14 +1,150 @@
+import os
+import re
 import shlex
+import statistics
+import subprocess
+import time
+from collections import OrderedDict
+from typing import Callable
 
-from gi.repository import Gio
-from ignis.services.applications import Application
+from gi.repository import Gdk, Gio, GLib, Gtk
+from ignis.services.applications import Application, ApplicationsService
 from ignis.utils import get_app_icon_name as ignis_get_app_icon_name
+from loguru import logger
 
-app_icon_overrides: dict[str, str] = {}
-app_id_overrides: dict[str, str] = {}
+FIELD_CODE = re.compile(r"%(.)")
+SINGLE_FILE_CODES = ("%f", "%u")
+MULTIPLE_FILE_CODES = ("%F", "%U")
+
+
+class AppInfoCache:
+    """
+    A bounded LRU cache of values resolved from app ids, e.g. icon names.
+
+    All instances are cleared when applications are reloaded, when the icon theme changes,
+    and when ``app_id_overrides`` or ``app_icon_overrides`` is edited.
+
+    Args:
+        name: Shown in ``AppInfoCache.report``.
+    """
+
+    MAX_SIZE = 512
+
+    instances: "list[AppInfoCache]" = []
+    __watching: bool = False
+
+    def __init__(self, name: str):
+        self.__entries: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self.name = name
+        self.hits: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+        self.instances.append(self)
+
+    def get(self, key: tuple[str, str], compute: Callable[[], str]) -> str:
+        """
+        Returns the value cached for ``key``, or caches the value returned by ``compute``.
+        """
+        value = self.__entries.get(key)
+        if value is not None:
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        AppInfoCache.__watch()
+        value = compute()
+        self.__entries[key] = value
+        if len(self.__entries) > self.MAX_SIZE:
+            self.__entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        if self.__entries:
+            self.__entries.clear()
+            self.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @classmethod
+    def invalidate_all(cls, *_):
+        for cache in cls.instances:
+            cache.clear()
+
+    @classmethod
+    def __watch(cls):
+        # connected on the first miss, so the display and services are ready
+        if cls.__watching:
+            return
+        cls.__watching = True
+
+        ApplicationsService.get_default().connect("notify::apps", cls.invalidate_all)
+        display = Gdk.Display.get_default()
+        if display:
+            Gtk.IconTheme.get_for_display(display).connect("changed", cls.invalidate_all)
+
+    @classmethod
+    def report(cls) -> str:
+        lines = [f"{'size':>6} {'hits':>8} {'misses':>8} {'hit rate':>9} {'cleared':>8}  name"]
+        for cache in cls.instances:
+            lookups = cache.hits + cache.misses
+            rate = cache.hits / lookups * 100 if lookups else 0
+            lines.append(
+                f"{len(cache):>6} {cache.hits:>8} {cache.misses:>8} {rate:>8.1f}% {cache.invalidations:>8}  {cache.name}"
+            )
+        return "\n".join(lines)
+
+
+class OverrideDict(dict[str, str]):
+    """
+    A dict which clears ``AppInfoCache`` whenever it is edited.
+    """
+
+    def __setitem__(self, key: str, value: str):
+        super().__setitem__(key, value)
+        AppInfoCache.invalidate_all()
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        AppInfoCache.invalidate_all()
+
+    def clear(self):
+        super().clear()
+        AppInfoCache.invalidate_all()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        AppInfoCache.invalidate_all()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        AppInfoCache.invalidate_all()
+        return item
+
+    def setdefault(self, key: str, default: str):  # type: ignore
+        value = super().setdefault(key, default)
+        AppInfoCache.invalidate_all()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        AppInfoCache.invalidate_all()
+
+
+app_icon_overrides: dict[str, str] = OverrideDict()
+app_id_overrides: dict[str, str] = OverrideDict()
+
+app_id_cache = AppInfoCache("app id")
+app_icon_cache = AppInfoCache("app icon")
 
 
 def get_app_id(app_id: str) -> str:
+    return app_id_cache.get((app_id, ""), lambda: _resolve_app_id(app_id))
+
+
+def _resolve_app_id(app_id: str) -> str:
     if not app_id:
         app_id = "unknown"
     if app_id.lower().endswith(".desktop"):
@@ -20,6 +156,13 @@ def get_app_id(app_id: str) -> str:
 
 
 def get_app_icon_name(app_id: str | None = None, app_info: Application | None = None) -> str:
+    if app_info and not app_info.id:
+        return _resolve_app_icon_name(app_id, app_info)
+    key = (app_id or "", app_info and app_info.id or "")
+    return app_icon_cache.get(key, lambda: _resolve_app_icon_name(app_id, app_info))
+
+
+def _resolve_app_icon_name(app_id: str | None, app_info: Application | None) -> str:
     app_id = app_id or app_info and app_info.id or ""
     app_id = get_app_id(app_id)
     icon = app_info and app_info.icon
@@ -32,16 +175,105 @@ def get_app_icon_name(app_id: str | None = None, app_info: Application | None =
     return icon
 
 
-def launch_application(
-    app: Application,
-    files: list[str] | None = None,
-    command_format: str | None = None,
-    terminal_format: str | None = None,
-):
-    if not app.exec_string:
-        return
+def _as_path(file: str) -> str:
+    if file.startswith("file://"):
+        return Gio.File.new_for_uri(file).get_path() or file
+    return file
+
+
+def expand_exec(
+    exec_string: str, files: list[str] | None = None, icon: str = "", name: str = "", location: str = ""
+) -> list[list[str]]:
+    """
+    Parses an ``Exec`` value of a desktop entry into argv, expanding field codes
+    as described by the Desktop Entry Specification.
+
+    ``%F``/``%U`` expand to all ``files``.
+    If only ``%f``/``%u`` is present, one argv is returned per file.
+    Raises ``ValueError`` if ``exec_string`` is not properly quoted.
+    """
+    template = shlex.split(exec_string)
+    files = files or []
+    if not any(code in template for code in MULTIPLE_FILE_CODES) and len(files) > 1:
+        if any(code in arg for arg in template for code in SINGLE_FILE_CODES):
+            return [_expand_argv(template, [file], icon, name, location) for file in files]
+    return [_expand_argv(template, files, icon, name, location)]
+
+
+def _expand_argv(template: list[str], files: list[str], icon: str, name: str, location: str) -> list[str]:
+    argv: list[str] = []
+    for arg in template:
+        match arg:
+            case "%F":
+                argv.extend(_as_path(file) for file in files)
+                continue
+            case "%U":
+                argv.extend(files)
+                continue
+            case "%i":
+                if icon:
+                    argv.extend(["--icon", icon])
+                continue
+
+        def replace(m: re.Match[str]) -> str:
+            match m.group(1):
+                case "f":
+                    return _as_path(files[0]) if files else ""
+                case "u":
+                    return files[0] if files else ""
+                case "c":
+                    return name
+                case "k":
+                    return location
+                case "%":
+                    return "%"
+                case _:
+                    # deprecated or unknown field codes
+                    return ""
+
+        expanded = FIELD_CODE.sub(replace, arg)
+        # drop arguments consisting only of field codes expanded to nothing, e.g. %f without files
+        if expanded or not FIELD_CODE.search(arg):
+            argv.append(expanded)
+    return argv
+
+
+def _popen_detached(argv: list[str], cwd: str | None = None, env: dict[str, str] | None = None) -> subprocess.Popen:
+    # like ``Application.launch``, the app runs in its own session with output silenced,
+    # so it neither floods the shell log nor gets killed with the shell
+    return subprocess.Popen(
+        argv,
+        cwd=cwd or None,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
-    command: str = app.exec_string
+
+def spawn_argv(argv: list[str], cwd: str | None = None, desktop_file: str | None = None):
+    """
+    Spawns ``argv`` without a shell, in a new session with output silenced, not waiting for it to exit.
+    Raises ``OSError`` if it can't be spawned.
+    """
+    env = None
+    if desktop_file:
+        env = dict(os.environ, GIO_LAUNCHED_DESKTOP_FILE=desktop_file)
+    process = _popen_detached(argv, cwd, env)
+
+    def on_exit(pid: int, status: int):
+        # reaped by GLib, so ``subprocess`` won't wait for it again
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+    GLib.child_watch_add(GLib.PRIORITY_DEFAULT, process.pid, on_exit)
+
+
+def shell_command(exec_string: str, files: list[str] | None = None, cwd: str | None = None) -> str:
+    """
+    Builds ``sh -c "cd <cwd>; <exec_string>"``, passing ``files`` for field codes.
+    """
+    command = exec_string
 
     # pass file paths as arguments
     files = [shlex.quote(file) for file in files or []]
@@ -51,19 +283,79 @@ def launch_application(
         command = command.replace(k, v)
 
     # set key "Path" as cwd
-    app_info: Gio.DesktopAppInfo = app.app
-    cwd = app_info.get_string("Path")
     if cwd:
         # cd xxx; nautilus --new-window file1 file2
         command = f"cd {shlex.quote(cwd)}; {command}"
 
     # sh -c "cd xxx; nautilus --new-window file1 file2"
-    command = f"sh -c {shlex.quote(command)}"
+    return f"sh -c {shlex.quote(command)}"
 
-    # apply customized launch command
+
+def launch_application(
+    app: Application,
+    files: list[str] | None = None,
+    command_format: str | None = None,
+    terminal_format: str | None = None,
+):
+    if not app.exec_string:
+        return
+
+    app_info: Gio.DesktopAppInfo = app.app
+    cwd = app_info.get_string("Path")
     format = terminal_format if app.is_terminal else command_format
+
+    # spawn directly if the command is not customized
+    if not format or format.strip() == "%command%":
+        try:
+            argvs = expand_exec(
+                app.exec_string,
+                files,
+                icon=app_info.get_string("Icon") or "",
+                name=app.name or "",
+                location=app_info.get_filename() or "",
+            )
+            for argv in argvs:
+                spawn_argv(argv, cwd=cwd, desktop_file=app_info.get_filename())
+            return
+        except ValueError as e:
+            logger.warning(f"Failed to parse Exec of {app.id}, launching with shell: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to spawn {app.id}: {e}")
+            return
+
+    command = shell_command(app.exec_string, files, cwd)
+
+    # apply customized launch command
     if format:
         # niri msg action spawn -- foot sh -c "cd xxx; yazi file"
         command = format.replace("%command%", command)
 
     app.launch(command_format=command, terminal_format=command)
+
+
+def benchmark_launch(runs: int = 20) -> str:
+    """
+    Compares the latency of launching through ``sh -c`` and spawning directly,
+    by launching ``true`` which exits right after exec, and waiting for it.
+    """
+    exec_string = "true %F"
+    direct: list[float] = []
+    shell: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for argv in expand_exec(exec_string):
+            _popen_detached(argv).wait()
+        direct.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        # the shell command is run by another shell in ``Application.launch``
+        command = shell_command(exec_string)
+        _popen_detached(["sh", "-c", command]).wait()
+        shell.append(time.perf_counter() - start)
+
+    lines = [f"Launch-to-exit latency of `true` over {runs} runs:"]
+    lines.append(f"{'':>8} {'median':>10} {'min':>10} {'max':>10}")
+    for label, times in (("direct", direct), ("sh -c", shell)):
+        ms = [t * 1000 for t in times]
+        lines.append(f"{label:>8} {statistics.median(ms):>7.2f} ms {min(ms):>7.2f} ms {max(ms):>7.2f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,71 @@
+import os
+import shlex
+from functools import lru_cache
+
+from ignis.services.hyprland import HyprlandService
+from ignis.services.niri import NiriService
+
+from .hypr import hypr_command
+from .misc import run_cmd_async
+from .niri import niri_action
+
+SHELL_CHARS = set("|&;<>()$`\\*?[]{}#~\n")
+"""Commands containing any of them are left to the shell."""
+
+
+def kebab_to_pascal(name: str) -> str:
+    return "".join(word.capitalize() for word in name.split("-"))
+
+
+@lru_cache(maxsize=64)
+def parse_native_cmd(cmd: str) -> tuple[str, ...] | tuple[str, str, dict[str, int]] | None:
+    """
+    Recognises commands which can be sent over the compositor socket, without spawning processes.
+
+    - ``niri msg action <action> [--<field> <integer>]...``, e.g. ``niri msg action focus-window --id 3``,
+      returns ``("niri", action, fields)``.
+    - ``hyprctl dispatch <dispatcher> [args]``, returns ``("hyprland", command)``.
+
+    Returns ``None`` if not recognised.
+    """
+    if any(ch in SHELL_CHARS for ch in cmd):
+        return None
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return None
+    if not argv:
+        return None
+
+    program = os.path.basename(argv[0])
+    if program == "niri" and argv[1:3] == ["msg", "action"] and len(argv) >= 4:
+        action, rest = argv[3], argv[4:]
+        if action.startswith("-") or len(rest) % 2 != 0:
+            return None
+
+        fields: dict[str, int] = {}
+        for flag, value in zip(rest[::2], rest[1::2]):
+            if not flag.startswith("--") or not value.lstrip("-").isdigit():
+                return None
+            fields[flag[2:].replace("-", "_")] = int(value)
+        return "niri", kebab_to_pascal(action), fields
+
+    if program == "hyprctl" and len(argv) >= 3 and argv[1] == "dispatch":
+        # hyprctl joins its arguments with spaces as well
+        return "hyprland", " ".join(argv[1:])
+
+    return None
+
+
+def run_user_cmd(cmd: str):
+    """
+    Runs a user configured command, sending it over the niri or Hyprland socket if recognised,
+    see ``parse_native_cmd``, or running it with ``run_cmd_async`` otherwise.
+    """
+    match parse_native_cmd(cmd):
+        case ("niri", action, fields) if NiriService.get_default().is_available:
+            niri_action(action, fields)
+        case ("hyprland", command) if HyprlandService.get_default().is_available:
+            hypr_command(command)
+        case _:
+            run_cmd_async(cmd)
@@ -5,3 +5,19 @@ def hypr_command(command: str):
     hypr = HyprlandService.get_default()
     if hypr.is_available:
         return hypr.send_command(command)
+
+
+def hypr_commands(commands: list[str]):
+    """
+    Sends multiple commands in one request, with Hyprland's ``[[BATCH]]`` syntax.
+
+    Example:
+
+    .. code-block:: python
+
+        hypr_commands(["dispatch focuswindow pid:1", "dispatch alterzorder top"])
+    """
+    if len(commands) == 1:
+        return hypr_command(commands[0])
+    if commands:
+        return hypr_command("[[BATCH]]" + ";".join(commands))
@@ -0,0 +1,82 @@
+import importlib
+import importlib.util
+import threading
+import time
+from types import ModuleType
+from typing import Any
+
+from loguru import logger
+
+from ..tracer import tracer
+
+
+class LazyModule:
+    """
+    A proxy of a module which is only imported on first attribute access,
+    for optional or rarely used dependencies kept off the startup path.
+
+    ``available`` checks whether the module is installed without importing it,
+    and turns ``False`` once importing it failed, e.g. for a broken installation.
+    """
+
+    load_times: dict[str, float] = {}
+    """Time in seconds spent importing each lazy module."""
+
+    def __init__(self, name: str):
+        self.__name = name
+        self.__module: ModuleType | None = None
+        self.__available: bool | None = None
+        self.__lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def available(self) -> bool:
+        if self.__available is None:
+            if self.__module is not None:
+                return True
+            try:
+                self.__available = importlib.util.find_spec(self.__name) is not None
+            except (ImportError, ValueError):
+                self.__available = False
+        return self.__available
+
+    @property
+    def loaded(self) -> bool:
+        return self.__module is not None
+
+    def load(self) -> ModuleType:
+        """
+        Imports the module if not imported yet. Raises ``ModuleNotFoundError`` if not installed.
+        """
+        if self.__module is not None:
+            return self.__module
+
+        with self.__lock:
+            if self.__module is None:
+                start = time.perf_counter()
+                with tracer.record(self.__name, "lazy-import"):
+                    self.__module = importlib.import_module(self.__name)
+                self.load_times[self.__name] = time.perf_counter() - start
+        return self.__module
+
+    def try_load(self) -> ModuleType | None:
+        """
+        Like ``load``, but returns ``None`` if the module can't be imported.
+        """
+        if not self.available:
+            return None
+        try:
+            return self.load()
+        except ImportError as e:
+            logger.warning(f"Failed to import {self.__name}: {e}")
+            self.__available = False
+            return None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule {self.__name} {'loaded' if self.loaded else 'not loaded'}>"
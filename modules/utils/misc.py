@@ -1,6 +1,6 @@
 import base64
 import os
-from asyncio import Task, create_subprocess_shell, create_task
+from asyncio import Semaphore, Task, create_subprocess_shell, create_task
 from typing import Any, Callable
 
 from ignis.utils import AsyncCompletedProcess, exec_sh_async
@@ -73,3 +73,46 @@ def run_cmd_async(cmd: str, pipe: bool = False, on_done: Callable[[Task[AsyncCom
         task.add_done_callback(on_done)
 
     return task
+
+
+class CommandRunner:
+    """
+    Runs shell commands without piping, for their return codes,
+    e.g. status commands polled by multiple widgets.
+
+    Identical commands in flight are run once, and their task is shared by callers.
+    At most ``max_concurrent`` subprocesses run at the same time, others wait in order.
+    """
+
+    def __init__(self, max_concurrent: int = 4):
+        self.__max_concurrent = max_concurrent
+        self.__semaphore: Semaphore | None = None
+        self.__inflight: dict[str, Task[AsyncCompletedProcess]] = {}
+        self.spawned: int = 0
+        """Number of subprocesses spawned."""
+        self.deduplicated: int = 0
+        """Number of runs served by a command already in flight."""
+
+    async def __run(self, cmd: str) -> AsyncCompletedProcess:
+        if self.__semaphore is None:
+            self.__semaphore = Semaphore(self.__max_concurrent)
+        async with self.__semaphore:
+            self.spawned += 1
+            return await exec_sh_async_nopipe(cmd)
+
+    def run(self, cmd: str, on_done: Callable[[Task[AsyncCompletedProcess]], object] | None = None):
+        task = self.__inflight.get(cmd)
+        if task:
+            self.deduplicated += 1
+        else:
+            task = create_task(self.__run(cmd))
+            self.__inflight[cmd] = task
+            task.add_done_callback(lambda _: self.__inflight.pop(cmd, None))
+
+        if on_done:
+            task.add_done_callback(on_done)
+
+        return task
+
+
+status_cmd_runner = CommandRunner()
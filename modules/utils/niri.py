@@ -3,7 +3,22 @@ from typing import Any
 from ignis.services.niri import NiriService
 
 
-def niri_action(action: str, args: Any = {}):
+def niri_actions(actions: list[tuple[str, Any]]) -> list[Any] | None:
+    """
+    Sends multiple actions in order, one request each, as niri replies to one request per connection.
+    Returns their replies.
+
+    Example:
+
+    .. code-block:: python
+
+        niri_actions([("FocusWindow", {"id": 1}), ("MaximizeColumn", {})])
+    """
     niri = NiriService.get_default()
-    if niri.is_available:
-        return niri.send_command({"Action": {action: args}})
+    if niri.is_available and actions:
+        return [niri.send_command({"Action": {action: args}}) for action, args in actions]
+
+
+def niri_action(action: str, args: Any = {}):
+    replies = niri_actions([(action, args)])
+    return replies[0] if replies else None
@@ -6,23 +6,25 @@ from ignis.options_manager import OptionsGroup
 from ignis.utils import debounce
 
 from .misc import is_instance_method, unpack_instance_method
-from .signal import WeakCallback
+from .signal import HandlerMonitor, WeakCallback
 
 
 def connect_option(group: OptionsGroup, option: str, callback: Callable):
+    label = HandlerMonitor.label(group, f"changed:{option}", callback)
     if is_instance_method(callback):
         obj, method = unpack_instance_method(callback)
 
         def cb(group: OptionsGroup, obj: Any, option_name: str):
             if option_name == option:
-                return method(obj, group, option_name)
+                return HandlerMonitor.call(label, method, obj, group, option_name)
 
-        WeakCallback(obj, debounce(500)(cb)).connect(group, "changed")
+        # ``cb`` times ``callback`` itself, not the debounce wrapper
+        WeakCallback(obj, debounce(500)(cb), monitored=False).connect(group, "changed")
     else:
 
         def cb2(group: OptionsGroup, option_name: str):
             if option_name == option:
-                callback(group, option_name)
+                HandlerMonitor.call(label, callback, group, option_name)
 
         group.connect("changed", debounce(500)(cb2))
 
@@ -0,0 +1,77 @@
+import os
+import subprocess
+from os import path
+from xml.sax.saxutils import escape
+
+from gi.repository import Gio, GLib
+from ignis import CACHE_DIR
+
+RESOURCE_PREFIX = "/com/github/ignis_niri_shell"
+bundle_file = path.join(CACHE_DIR, "ignis-shell.gresource")
+
+_resource: Gio.Resource | None = None
+
+
+def compile_resource_bundle(files: list[str], sourcedir: str = CACHE_DIR, target: str = bundle_file):
+    """
+    Packs ``files``, relative to ``sourcedir``, into a GResource bundle with ``glib-compile-resources``.
+    """
+    xml_filename = target + ".xml"
+    with open(xml_filename, "w") as xml:
+        xml.write('<?xml version="1.0" encoding="UTF-8"?>\n<gresources>\n')
+        xml.write(f'  <gresource prefix="{RESOURCE_PREFIX}">\n')
+        for file in sorted(files):
+            xml.write(f"    <file>{escape(file)}</file>\n")
+        xml.write("  </gresource>\n</gresources>\n")
+
+    result = subprocess.run(
+        args=["glib-compile-resources", f"--sourcedir={sourcedir}", f"--target={target}.tmp", xml_filename]
+    )
+    if result.returncode != 0:
+        raise Exception(f"glib-compile-resources exits with return code {result.returncode}")
+    os.replace(target + ".tmp", target)
+
+
+def load_resource_bundle(target: str = bundle_file) -> bool:
+    """
+    Memory-maps and registers the bundle. Returns whether the bundle is available.
+    """
+    global _resource
+    if _resource is not None:
+        return True
+
+    try:
+        resource = Gio.Resource.load(target)
+    except GLib.Error:
+        return False
+
+    Gio.resources_register(resource)
+    _resource = resource
+    return True
+
+
+def resource_path(name: str) -> str | None:
+    """
+    Returns the resource path of ``name`` if it is in the registered bundle.
+    """
+    if _resource is None:
+        return None
+
+    rpath = f"{RESOURCE_PREFIX}/{name}"
+    try:
+        _resource.get_info(rpath, Gio.ResourceLookupFlags.NONE)
+        return rpath
+    except GLib.Error:
+        return None
+
+
+def lookup_resource_text(name: str) -> str | None:
+    """
+    Returns the content of ``name`` in the registered bundle as text.
+    """
+    rpath = resource_path(name)
+    if _resource is None or rpath is None:
+        return None
+
+    data = _resource.lookup_data(rpath, Gio.ResourceLookupFlags.NONE).get_data()
+    return bytes(data).decode() if data is not None else None
@@ -0,0 +1,157 @@
+import math
+import os
+import shlex
+from typing import Callable
+
+from gi.repository import Gio
+from ignis.services.applications import Application
+
+
+def fuzzy_score(pattern: str, text: str) -> int:
+    """
+    Scores how well ``pattern`` matches ``text`` as a subsequence.
+    Both should be lower cased. Returns ``0`` if not matched.
+
+    Substrings score higher than scattered characters,
+    and matches at the start of ``text`` or of a word score higher than others.
+    """
+    if not pattern or len(pattern) > len(text):
+        return 0
+
+    pos = text.find(pattern)
+    if pos >= 0:
+        score = 16 * len(pattern)
+        if pos == 0:
+            score += 32
+        elif not text[pos - 1].isalnum():
+            score += 16
+        return score
+
+    score = 0
+    prev = -2
+    idx = 0
+    for ch in pattern:
+        idx = text.find(ch, idx)
+        if idx < 0:
+            return 0
+        if idx == prev + 1:
+            score += 8
+        elif idx == 0 or not text[idx - 1].isalnum():
+            score += 6
+        else:
+            score += 1
+        prev = idx
+        idx += 1
+    return score
+
+
+class AppSearchIndex:
+    """
+    An in-process search index of applications.
+
+    Name, generic name, keywords, executable and id of each application are indexed,
+    and queries are matched as fuzzy subsequences of them.
+    If a query extends the previous one, only the previous results are scored again.
+    """
+
+    FIELD_WEIGHTS = (4, 2, 2, 2, 1)
+    """Weights of name, generic name, keywords, executable and id."""
+
+    class Entry:
+        def __init__(self, app: Application):
+            app_info: Gio.DesktopAppInfo = app.app
+            self.app_id: str = app.id or ""
+            self.name: str = (app.name or "").lower()
+            self.fields: tuple[str, ...] = (
+                self.name,
+                (app_info.get_generic_name() or "").lower(),
+                " ".join(app_info.get_keywords() or []).lower(),
+                AppSearchIndex.exec_name(app.exec_string or "").lower(),
+                self.app_id.lower(),
+            )
+            self.chars: set[str] = set("".join(self.fields))
+
+        def score(self, terms: list[str]) -> int:
+            total = 0
+            for term in terms:
+                best = 0
+                for weight, field in zip(AppSearchIndex.FIELD_WEIGHTS, self.fields):
+                    best = max(best, weight * fuzzy_score(term, field))
+                if best == 0:
+                    return 0
+                total += best
+            return total
+
+    def __init__(self):
+        self.__entries: list[AppSearchIndex.Entry] = []
+        self.__char_index: dict[str, set[int]] = {}
+        """Maps a character to indexes of entries containing it."""
+        self.__last_query: str = ""
+        self.__last_matches: list[int] = []
+
+    @staticmethod
+    def exec_name(exec_string: str) -> str:
+        """
+        Returns the basename of the executable in ``exec_string``.
+        """
+        try:
+            argv = shlex.split(exec_string)
+        except ValueError:
+            argv = exec_string.split()
+        return os.path.basename(argv[0]) if argv else ""
+
+    def rebuild(self, apps: list[Application]):
+        self.__entries = [self.Entry(app) for app in apps if app.id]
+        self.__char_index = {}
+        for i, entry in enumerate(self.__entries):
+            for ch in entry.chars:
+                self.__char_index.setdefault(ch, set()).add(i)
+        self.__last_query = ""
+        self.__last_matches = []
+
+    def __candidates(self, query: str) -> list[int] | set[int]:
+        if self.__last_query and query.startswith(self.__last_query):
+            # matches of an extended query are always matches of the previous one
+            return self.__last_matches
+
+        candidates: set[int] | None = None
+        for ch in set(query.replace(" ", "")):
+            indexes = self.__char_index.get(ch, set())
+            candidates = indexes if candidates is None else candidates & indexes
+            if not candidates:
+                return set()
+        return candidates if candidates is not None else set()
+
+    def search(self, query: str, boost: Callable[[str], float] | None = None) -> dict[str, int]:
+        """
+        Returns a dict mapping app ids of matched applications to their rank, ``0`` being the best.
+
+        Args:
+            query: The search text.
+            boost: Returns a non-negative weight of an app id, e.g. its launch frecency,
+                which raises the rank of matched apps slightly.
+        """
+        query = query.lower()
+        terms = query.split()
+        if not terms:
+            self.__last_query = ""
+            self.__last_matches = []
+            return {}
+
+        scored: list[tuple[float, int]] = []
+        for i in self.__candidates(query):
+            score = self.__entries[i].score(terms)
+            if score > 0:
+                scored.append((score, i))
+
+        self.__last_query = query
+        self.__last_matches = [i for _, i in scored]
+
+        if boost:
+            scored = [(score + 8 * math.log2(1 + boost(self.__entries[i].app_id)), i) for score, i in scored]
+
+        scored.sort(key=lambda s: (-s[0], self.__entries[s[1]].name))
+        result: dict[str, int] = {}
+        for _, i in scored:
+            result.setdefault(self.__entries[i].app_id, len(result))
+        return result
@@ -1,7 +1,9 @@
+import time
 import weakref
-from typing import Any, Callable, TypeAlias
+from collections import deque
+from typing import Any, Callable, NamedTuple, TypeAlias
 
-from gi.repository import GObject
+from gi.repository import GLib, GObject, Gtk
 
 from .misc import is_instance_method, unpack_instance_method
 
@@ -9,6 +11,118 @@ from .misc import is_instance_method, unpack_instance_method
 SpecType: TypeAlias = "SignalSpec | BindingSpec"
 
 
+class HandlerMonitor:
+    """
+    Times signal handlers connected through ``SignalSpec``, ``SpecsBase.signal``,
+    ``WeakCallback``, ``WeakMethod``, ``weak_connect`` and ``connect_option``.
+
+    Handlers are always wrapped, but only timed while ``enabled`` or ``profiling``:
+
+    - ``enabled``: calls slower than ``SLOW_MS`` are kept in a rolling list,
+      so stalls of the main loop can be attributed to them.
+    - ``profiling``: every call is counted, and its wall time accumulated per handler.
+    """
+
+    class Label(NamedTuple):
+        signal: str
+        """Signal name, prefixed by the type of the emitter."""
+        handler: str
+        """Qualified name of the callback."""
+
+        def __str__(self) -> str:
+            return f"{self.signal} {self.handler}"
+
+    enabled: bool = False
+    profiling: bool = False
+    SLOW_MS = 8
+    slow_calls: "deque[tuple[float, HandlerMonitor.Label, float]]" = deque(maxlen=512)
+    """Slow calls as ``(end time, label, duration)``, times in seconds from ``time.perf_counter``."""
+    profile: "dict[HandlerMonitor.Label, list[float]]" = {}
+    """Maps a handler to ``[count, total time]`` while ``profiling``."""
+
+    @classmethod
+    def label(cls, gobject: GObject.Object | None, signal: str, callback: Callable) -> "HandlerMonitor.Label":
+        name = getattr(callback, "__qualname__", None) or repr(callback)
+        return cls.Label(f"{type(gobject).__name__}::{signal}" if gobject is not None else signal, name)
+
+    @classmethod
+    def call(cls, label: "HandlerMonitor.Label", callback: Callable, *args) -> Any:
+        if not cls.enabled and not cls.profiling:
+            return callback(*args)
+
+        start = time.perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            end = time.perf_counter()
+            if cls.profiling:
+                stats = cls.profile.get(label)
+                if stats:
+                    stats[0] += 1
+                    stats[1] += end - start
+                else:
+                    cls.profile[label] = [1, end - start]
+            if cls.enabled and (end - start) * 1000 >= cls.SLOW_MS:
+                cls.slow_calls.append((end, label, end - start))
+
+    @classmethod
+    def wrap(cls, label: "HandlerMonitor.Label", callback: Callable) -> Callable:
+        def wrapper(*args):
+            return cls.call(label, callback, *args)
+
+        return wrapper
+
+    @classmethod
+    def slowest_since(cls, since: float) -> "tuple[HandlerMonitor.Label, float] | None":
+        """
+        Returns the label and duration of the slowest call which ended after ``since``.
+        """
+        slowest: tuple[HandlerMonitor.Label, float] | None = None
+        for end, label, duration in reversed(cls.slow_calls):
+            if end < since:
+                break
+            if not slowest or duration > slowest[1]:
+                slowest = (label, duration)
+        return slowest
+
+    @classmethod
+    def top(cls, n: int = 10) -> "list[tuple[HandlerMonitor.Label, int, float, float]]":
+        """
+        Aggregates the rolling list of slow calls.
+        Returns the top ``n`` handlers as ``(label, count, total, max)``, by total time.
+        """
+        stats: dict[HandlerMonitor.Label, list[float]] = {}
+        for _, label, duration in cls.slow_calls:
+            s = stats.setdefault(label, [0, 0.0, 0.0])
+            s[0] += 1
+            s[1] += duration
+            s[2] = max(s[2], duration)
+        items = [(label, int(c), total, peak) for label, (c, total, peak) in stats.items()]
+        return sorted(items, key=lambda t: t[2], reverse=True)[:n]
+
+    @classmethod
+    def profile_table(cls, n: int | None = None, sep: str | None = None) -> str:
+        """
+        Formats the profile of handlers by total time, the top ``n`` only if given.
+
+        Args:
+            sep: Separates columns instead of aligning them, e.g. ``"\\t"`` for TSV.
+        """
+        rows = sorted(cls.profile.items(), key=lambda t: t[1][1], reverse=True)[:n]
+        if sep is not None:
+            lines = [sep.join(["calls", "total_ms", "mean_us", "signal", "handler"])]
+            for label, (count, total) in rows:
+                lines.append(
+                    sep.join([str(int(count)), f"{total * 1000:.3f}", f"{total / count * 1e6:.1f}", *label])
+                )
+            return "\n".join(lines)
+
+        lines = [f"{'calls':>8} {'total':>10} {'mean':>10}  signal / handler"]
+        for label, (count, total) in rows:
+            lines.append(f"{int(count):>8} {total * 1000:>7.1f} ms {total / count * 1e6:>7.0f} us  {label}")
+        return "\n".join(lines)
+
+
 class SignalSpec:
     """
     Keeps a signal connection spec and disconnects on ``__del__``.
@@ -26,6 +140,7 @@ class SignalSpec:
         """
         Connects to a signal and returns a ``SignalSpec``.
         """
+        callback = HandlerMonitor.wrap(HandlerMonitor.label(gobject, signal, callback), callback)
         spec = gobject.connect(signal, callback, *args)
         return cls(gobject, spec)
 
@@ -104,6 +219,8 @@ class WeakCallback:
         func: A callback function, with ``gobject`` and ``obj`` as the first two arguments.
         swap: Whether to swap positions of ``gobject`` and ``obj``.
         default_callback: Invoked when ``obj`` is lost.
+        monitored: Whether calls are timed by ``HandlerMonitor``,
+            disabled for wrappers timing the actual callback themselves.
 
     Example:
 
@@ -118,21 +235,32 @@ class WeakCallback:
                 pass
     """
 
-    def __init__(self, obj: Any, func: Callable, swap: bool = False, default_callback: Callable | None = None):
+    def __init__(
+        self,
+        obj: Any,
+        func: Callable,
+        swap: bool = False,
+        default_callback: Callable | None = None,
+        monitored: bool = True,
+    ):
         self.__obj = weakref.ref(obj)
         self.__func = func
         self.__swap = swap
         self.__default = default_callback
         self.__spec: int | None = None
+        # labelled by the owner class until connected, e.g. when passed to ``set_on_click`` directly
+        self.__label: HandlerMonitor.Label | None = (
+            HandlerMonitor.label(None, type(obj).__name__, func) if monitored else None
+        )
 
     def __call__(self, gobject: GObject.Object, *args):
         # If ``obj`` lost, disconnect from signal on invoked.
         obj = self.__obj()
         if obj:
-            if not self.__swap:
-                return self.__func(gobject, obj, *args)
-            else:
-                return self.__func(obj, gobject, *args)
+            args = (gobject, obj, *args) if not self.__swap else (obj, gobject, *args)
+            if self.__label is None:
+                return self.__func(*args)
+            return HandlerMonitor.call(self.__label, self.__func, *args)
         else:
             self.disconnect(gobject)
             if self.__default:
@@ -148,6 +276,8 @@ class WeakCallback:
         keeping the ``spec`` for disconnecting.
         """
         if not self.__spec and self.__obj():
+            if self.__label is not None:
+                self.__label = HandlerMonitor.label(gobject, signal, self.__func)
             self.__spec = gobject.connect(signal, self, *args)
             return self
         else:
@@ -222,4 +352,109 @@ def weak_connect(gobject: GObject.Object, signal: str, callback: Callable, *args
     if is_instance_method(callback):
         return weak_connect_method(gobject, signal, callback, *args)
     else:
-        return gobject.connect(signal, callback, *args)
+        label = HandlerMonitor.label(gobject, signal, callback)
+        return gobject.connect(signal, HandlerMonitor.wrap(label, callback), *args)
+
+
+class FrameCoalescer:
+    """
+    Merges calls arriving within the same frame into a single deferred call to ``callback``.
+
+    The call is deferred to the next frame clock tick of ``widget`` if it is mapped,
+    or to an idle source running right before GTK's layout and paint otherwise.
+    Arguments of the merged calls are dropped.
+
+    Args:
+        callback: Invoked without arguments. Instance methods are referenced weakly.
+        widget: The widget whose frame clock is used.
+        name: Shown in ``FrameCoalescer.report``.
+
+    Example:
+
+    .. code-block:: python
+
+        class MyBox(Gtk.Box):
+            def __init__(self):
+                super().__init__()
+                self.__update = FrameCoalescer(self.update, self, "my-box")
+                stream.connect("notify::volume", self.__update)
+                stream.connect("notify::is-muted", self.__update)
+
+            def update(self):
+                pass
+    """
+
+    PRIORITY = GLib.PRIORITY_HIGH_IDLE + 10
+    """Higher than ``GDK_PRIORITY_REDRAW``, so flushed before the next frame is painted."""
+
+    instances: "weakref.WeakSet[FrameCoalescer]" = weakref.WeakSet()
+
+    def __init__(self, callback: Callable[[], Any], widget: Gtk.Widget | None = None, name: str = ""):
+        if is_instance_method(callback):
+            obj, func = unpack_instance_method(callback)
+            ref_obj = weakref.ref(obj)
+
+            def weak_callback():
+                obj = ref_obj()
+                if obj:
+                    return func(obj)
+
+            self.__callback = weak_callback
+        else:
+            self.__callback = callback
+        self.__widget = weakref.ref(widget) if widget else None
+        self.__pending: bool = False
+        self.name = name or getattr(callback, "__qualname__", repr(callback))
+        self.received: int = 0
+        """Number of calls received."""
+        self.flushed: int = 0
+        """Number of calls to ``callback``."""
+        self.instances.add(self)
+
+    def __call__(self, *_):
+        self.received += 1
+        if self.__pending:
+            return
+
+        self.__pending = True
+        widget = self.__widget and self.__widget()
+        if widget and widget.get_mapped():
+            widget.add_tick_callback(self.__on_tick)
+        else:
+            GLib.idle_add(self.__flush, priority=self.PRIORITY)
+
+    @property
+    def collapsed(self) -> int:
+        """
+        Number of calls merged into others.
+        """
+        return self.received - self.flushed - (1 if self.__pending else 0)
+
+    def flush(self):
+        """
+        Invokes ``callback`` now if there are pending calls.
+        """
+        if self.__pending:
+            self.__flush()
+
+    def __on_tick(self, *_) -> bool:
+        if self.__pending:
+            self.__flush()
+        return GLib.SOURCE_REMOVE
+
+    def __flush(self, *_) -> bool:
+        if self.__pending:
+            self.__pending = False
+            self.flushed += 1
+            self.__callback()
+        return GLib.SOURCE_REMOVE
+
+    @classmethod
+    def report(cls) -> str:
+        """
+        Formats counters of all living coalescers as a table.
+        """
+        lines = [f"{'received':>10} {'flushed':>10} {'collapsed':>10}  name"]
+        for c in sorted(cls.instances, key=lambda c: c.collapsed, reverse=True):
+            lines.append(f"{c.received:>10} {c.flushed:>10} {c.collapsed:>10}  {c.name}")
+        return "\n".join(lines)
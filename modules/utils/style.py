@@ -0,0 +1,91 @@
+import glob
+import hashlib
+import os
+import re
+from os import path
+
+from ignis import CACHE_DIR
+from ignis.utils import sass_compile
+from loguru import logger
+
+cache_css_path = path.join(CACHE_DIR, "css")
+
+_import_re = re.compile(r"""@(?:use|forward|import)\s+["']([^"']+)["']""")
+
+
+def _resolve_import(dirname: str, name: str) -> str | None:
+    candidates = [name] if path.splitext(name)[1] else []
+    candidates += [
+        f"{name}.scss",
+        path.join(path.dirname(name), f"_{path.basename(name)}.scss"),
+        path.join(name, "_index.scss"),
+        path.join(name, "index.scss"),
+    ]
+    for candidate in candidates:
+        filename = path.join(dirname, candidate)
+        if path.isfile(filename):
+            return filename
+    return None
+
+
+def scss_sources(filename: str) -> list[str]:
+    """
+    Returns ``filename`` and all SCSS files it imports, recursively, in a stable order.
+    Built-in modules like ``sass:list`` are skipped.
+    """
+    sources: list[str] = []
+    pending = [path.abspath(filename)]
+    while pending:
+        current = pending.pop()
+        if current in sources:
+            continue
+        sources.append(current)
+        with open(current) as file:
+            content = file.read()
+        for name in _import_re.findall(content):
+            if name.startswith("sass:"):
+                continue
+            imported = _resolve_import(path.dirname(current), name)
+            if imported:
+                pending.append(imported)
+    return sources
+
+
+def scss_hash(filename: str) -> str:
+    """
+    Hashes the content of ``filename`` and all SCSS files it imports.
+    """
+    digest = hashlib.sha256()
+    for source in scss_sources(filename):
+        digest.update(source.encode())
+        with open(source, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+
+def cached_sass_compile(filename: str) -> str:
+    """
+    Compiles ``filename`` with ``sass_compile``, reusing the CSS cached under ``CACHE_DIR``
+    if none of the imported SCSS files changed.
+    """
+    stem = path.splitext(path.basename(filename))[0]
+    css_filename = path.join(cache_css_path, f"{stem}.{scss_hash(filename)[:16]}.css")
+    try:
+        with open(css_filename) as file:
+            return file.read()
+    except FileNotFoundError:
+        pass
+
+    css = sass_compile(path=filename)
+
+    try:
+        os.makedirs(cache_css_path, exist_ok=True)
+        for outdated in glob.glob(path.join(glob.escape(cache_css_path), f"{glob.escape(stem)}.*.css")):
+            os.remove(outdated)
+        with open(css_filename + ".tmp", "w") as file:
+            file.write(css)
+        os.replace(css_filename + ".tmp", css_filename)
+    except OSError as e:
+        logger.warning(f"Failed to cache compiled CSS of {filename}: {e}")
+
+    return css
@@ -1,16 +1,147 @@
+import hashlib
+import json
 import os
+import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 from typing import Any, Callable
 
 from gi.repository import Gtk
 from ignis import CACHE_DIR
+from loguru import logger
+
 from ..constants import CONFIG_DIR
+from ..tracer import tracer
+from .resource import compile_resource_bundle, load_resource_bundle, resource_path
+from .resource import bundle_file as resource_bundle_file
+from .style import cached_sass_compile, scss_hash
 
 blp_ui_path = path.join(CONFIG_DIR, "ui")
 cache_ui_path = path.join(CACHE_DIR, "ui")
 
 
+class UiManifest:
+    """
+    Records which blueprint sources the cached ``.ui`` files are compiled from.
+
+    Each blueprint file is keyed by the hash of its content and the compiler version,
+    so touching or copying files does not trigger recompiling, while any content change does.
+    Stats of the files are also recorded, so unchanged files are not hashed again.
+    """
+
+    FILE = path.join(cache_ui_path, "manifest.json")
+
+    def __init__(self):
+        # dict[filename, {"mtime_ns", "size", "hash", "compiler"}]
+        self.files: dict[str, dict[str, Any]] = {}
+        # {"path", "mtime_ns", "size", "version"}
+        self.compiler: dict[str, Any] = {}
+        self.__dirty = False
+        self.__compiler_version: str | None = None
+        self.__ui_files: set[str] | None = None
+
+        try:
+            with open(self.FILE) as file:
+                data = json.load(file)
+                self.files = data.get("files", {})
+                self.compiler = data.get("compiler", {})
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def compiler_version(self) -> str:
+        """
+        Version of ``blueprint-compiler``, only queried again if the executable changed.
+        """
+        if self.__compiler_version is not None:
+            return self.__compiler_version
+
+        version = ""
+        exe = shutil.which("blueprint-compiler")
+        if exe:
+            st = os.stat(exe)
+            c = self.compiler
+            if c.get("path") == exe and c.get("mtime_ns") == st.st_mtime_ns and c.get("size") == st.st_size:
+                version = c.get("version", "")
+            else:
+                result = subprocess.run([exe, "--version"], capture_output=True, text=True)
+                version = result.stdout.strip()
+                self.compiler = {"path": exe, "mtime_ns": st.st_mtime_ns, "size": st.st_size, "version": version}
+                self.__dirty = True
+        self.__compiler_version = version
+        return version
+
+    def __ui_exists(self, filename: str) -> bool:
+        if self.__ui_files is None:
+            # a single sweep of the cache directory instead of a stat per file
+            self.__ui_files = set()
+            for dirpath, _, files in os.walk(cache_ui_path):
+                for file in files:
+                    if file.endswith(".ui"):
+                        self.__ui_files.add(path.relpath(path.join(dirpath, file), cache_ui_path)[:-3])
+        return filename in self.__ui_files
+
+    @staticmethod
+    def hash_file(filename: str) -> str:
+        with open(filename, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    def is_fresh(self, filename: str, st: os.stat_result) -> bool:
+        """
+        Checks whether the cached ``.ui`` file of ``filename`` is compiled from its current content.
+        """
+        if not self.__ui_exists(filename):
+            return False
+
+        record = self.files.get(filename)
+        if not record:
+            return False
+        if record.get("mtime_ns") == st.st_mtime_ns and record.get("size") == st.st_size:
+            return record.get("compiler") == self.compiler_version
+
+        # stats changed, e.g. touched or copied, compare the content
+        digest = self.hash_file(path.join(blp_ui_path, filename + ".blp"))
+        if record.get("hash") != digest or record.get("compiler") != self.compiler_version:
+            return False
+
+        record["mtime_ns"], record["size"] = st.st_mtime_ns, st.st_size
+        self.__dirty = True
+        return True
+
+    def update(self, filename: str):
+        """
+        Records ``filename`` as freshly compiled.
+        """
+        blp_filename = path.join(blp_ui_path, filename + ".blp")
+        st = os.stat(blp_filename)
+        self.files[filename] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "hash": self.hash_file(blp_filename),
+            "compiler": self.compiler_version,
+        }
+        if self.__ui_files is not None:
+            self.__ui_files.add(filename)
+        self.__dirty = True
+
+    def save(self):
+        if not self.__dirty:
+            return
+
+        os.makedirs(cache_ui_path, exist_ok=True)
+        with open(self.FILE + ".tmp", "w") as file:
+            json.dump({"compiler": self.compiler, "files": self.files}, file, separators=(",", ":"))
+        os.replace(self.FILE + ".tmp", self.FILE)
+        self.__dirty = False
+
+
+ui_manifest = UiManifest()
+fresh_ui_files: set[str] = set()
+"""Blueprint files already checked or compiled in this process."""
+
+
 def build_blueprint(blp_filename: str, ui_filename: str):
     os.makedirs(os.path.dirname(ui_filename), exist_ok=True)
 
@@ -20,36 +151,151 @@ def build_blueprint(blp_filename: str, ui_filename: str):
         raise Exception(f"blueprint-compiler exits with return code {result.returncode}")
 
 
+def find_stale_blueprints() -> list[str]:
+    """
+    Finds blueprint files under ``ui/`` whose compiled ``.ui`` files are missing or outdated.
+    Returns filenames relative to ``ui/``, without the extension.
+    """
+    stale: list[str] = []
+    for dirpath, _, files in os.walk(blp_ui_path):
+        for file in files:
+            if not file.endswith(".blp"):
+                continue
+            blp_filename = os.path.join(dirpath, file)
+            filename = os.path.relpath(blp_filename, blp_ui_path)[:-4]
+            if ui_manifest.is_fresh(filename, os.stat(blp_filename)):
+                fresh_ui_files.add(filename)
+            else:
+                stale.append(filename)
+    return stale
+
+
+def build_blueprints(filenames: list[str]) -> dict[str, float]:
+    """
+    Compiles blueprint files in parallel.
+    Returns the compile time of each file in seconds.
+    """
+
+    def build(filename: str) -> float:
+        start = time.perf_counter()
+        build_blueprint(os.path.join(blp_ui_path, filename + ".blp"), os.path.join(cache_ui_path, filename + ".ui"))
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        times = dict(zip(filenames, executor.map(build, filenames)))
+
+    for filename in filenames:
+        ui_manifest.update(filename)
+        fresh_ui_files.add(filename)
+    return times
+
+
+def prebuild_blueprints():
+    """
+    Compiles all stale blueprint files at once,
+    which should run before any ``gtk_template`` is declared.
+    """
+    stale = find_stale_blueprints()
+    if not stale:
+        ui_manifest.save()
+        return
+
+    start = time.perf_counter()
+    times = build_blueprints(stale)
+    elapsed = time.perf_counter() - start
+    ui_manifest.save()
+
+    logger.info(f"Compiled {len(times)} blueprint files in {elapsed * 1000:.0f} ms")
+    for filename, seconds in sorted(times.items(), key=lambda t: t[1], reverse=True):
+        logger.info(f"{seconds * 1000:>8.0f} ms  {filename}.blp")
+
+
+def ensure_resource_bundle(style_filename: str | None = None) -> bool:
+    """
+    Packs all compiled templates, and the CSS compiled from ``style_filename``,
+    into a single GResource bundle, then registers it, so templates are loaded from one memory-mapped file.
+    The bundle is only rebuilt if any of its sources changed.
+    Should run after ``prebuild_blueprints``. Returns whether the bundle is registered,
+    ``False`` if building it failed.
+    """
+    ui_files = sorted(fresh_ui_files)
+    stamp = json.dumps(
+        {
+            "compiler": ui_manifest.compiler_version,
+            "ui": {filename: ui_manifest.files.get(filename, {}).get("hash") for filename in ui_files},
+            "style": scss_hash(style_filename) if style_filename else None,
+        },
+        sort_keys=True,
+    )
+    stamp_file = resource_bundle_file + ".stamp"
+    try:
+        with open(stamp_file) as file:
+            fresh = file.read() == stamp and path.exists(resource_bundle_file)
+    except OSError:
+        fresh = False
+
+    if not fresh:
+        start = time.perf_counter()
+        files = [f"ui/{filename}.ui" for filename in ui_files]
+        try:
+            if style_filename:
+                with open(path.join(CACHE_DIR, "style.css"), "w") as file:
+                    file.write(cached_sass_compile(style_filename))
+                files.append("style.css")
+            compile_resource_bundle(files)
+            with open(stamp_file, "w") as file:
+                file.write(stamp)
+        except Exception as e:
+            # e.g. glib-compile-resources is not installed, templates and styles are loaded from files instead
+            logger.warning(f"Failed to build resource bundle, falling back to files: {e}")
+            return False
+        logger.info(f"Built resource bundle of {len(files)} files in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    return load_resource_bundle()
+
+
 def ensure_ui_file(filename: str) -> str:
     blp_filename = os.path.join(blp_ui_path, filename + ".blp")
     ui_filename = os.path.join(cache_ui_path, filename + ".ui")
 
-    blp_exist = os.path.exists(blp_filename)
-    ui_exist = os.path.exists(ui_filename)
+    if filename in fresh_ui_files:
+        return ui_filename
 
-    if blp_exist:
-        if ui_exist:
-            blp_mtime = os.path.getmtime(blp_filename)
-            ui_mtime = os.path.getmtime(ui_filename)
+    try:
+        st = os.stat(blp_filename)
+    except FileNotFoundError:
+        if os.path.exists(ui_filename):
+            return ui_filename
+        raise Exception(f"blueprint file `{blp_filename}` does not exist")
 
-            if ui_mtime < blp_mtime:
-                build_blueprint(blp_filename, ui_filename)
-        else:
-            build_blueprint(blp_filename, ui_filename)
-    else:
-        if ui_exist:
-            pass
-        else:
-            raise Exception(f"blueprint file `{blp_filename}` does not exist")
+    if not ui_manifest.is_fresh(filename, st):
+        build_blueprint(blp_filename, ui_filename)
+        ui_manifest.update(filename)
+        ui_manifest.save()
+    fresh_ui_files.add(filename)
 
     return ui_filename
 
 
-def gtk_template[Widget: type[Gtk.Widget]](filename: str) -> Callable[[Widget], Widget]:
-    template = Gtk.Template(filename=ensure_ui_file(filename))
+def new_builder(filename: str) -> Gtk.Builder:
+    """
+    Creates a ``Gtk.Builder`` from the compiled blueprint, preferring the resource bundle.
+    """
+    ui_resource = resource_path(f"ui/{filename}.ui")
+    if ui_resource:
+        return Gtk.Builder.new_from_resource(ui_resource)
+    return Gtk.Builder.new_from_file(ensure_ui_file(filename))
 
+
+def gtk_template[Widget: type[Gtk.Widget]](filename: str) -> Callable[[Widget], Widget]:
     def decorator(cls: Widget) -> Widget:
-        return template(cls)  # type: ignore
+        with tracer.span(filename, "template"):
+            ui_resource = resource_path(f"ui/{filename}.ui")
+            if ui_resource:
+                template = Gtk.Template(resource_path=ui_resource)
+            else:
+                template = Gtk.Template(filename=ensure_ui_file(filename))
+            return template(cls)  # type: ignore
 
     return decorator
 
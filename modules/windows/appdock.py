@@ -1,158 +1,33 @@
+import dataclasses
+import weakref
+
 from gi.repository import Gdk, Gio, Gtk
 from ignis.menu_model import IgnisMenuItem, IgnisMenuModel, IgnisMenuSeparator, ItemsType
-from ignis.services.applications import Application, ApplicationsService
-from ignis.services.hyprland import HyprlandService, HyprlandWindow
-from ignis.services.niri import NiriService, NiriWindow
+from ignis.services.applications import Application
+from ignis.services.niri import NiriService
 from ignis.utils import Timeout
 from ignis.widgets import Window
+from loguru import logger
 
 from ..constants import WindowName
+from ..services import DockModel, FrecencyService, WindowFocusHistory, WindowInfo
 from ..useroptions import user_options
 from ..utils import (
     SpecsBase,
     WeakMethod,
     connect_option,
     get_app_icon_name,
-    get_app_id,
     get_widget_monitor,
     gtk_template,
     gtk_template_child,
-    hypr_command,
     launch_application,
-    niri_action,
     set_on_click,
     set_on_scroll,
 )
 
 
-class WindowInfo:
-    """
-    A wrapper to unify queries on ``NiriWindow`` and ``HyprlandWindow``.
-    """
-
-    def __init__(self, window: NiriWindow | HyprlandWindow):
-        self.window = window
-
-        self.id = 0
-        self.pid = window.pid
-        self.app_id = ""
-        self.workspace_id = window.workspace_id
-        self.title = window.title
-
-        if isinstance(window, NiriWindow):
-            self.id = window.id
-            self.app_id = window.app_id
-        else:
-            self.id = window.pid
-            self.app_id = window.class_name
-
-    def focus(self):
-        if isinstance(self.window, NiriWindow):
-            self.window.focus()
-        elif isinstance(self.window, HyprlandWindow):
-            hypr_command(f"dispatch focuswindow pid:{self.window.pid}")
-            hypr_command("dispatch alterzorder top")
-
-    def maximize(self):
-        self.focus()
-        if isinstance(self.window, NiriWindow):
-            if not self.window.is_floating:
-                niri_action("MaximizeColumn")
-        elif isinstance(self.window, HyprlandWindow):
-            hypr_command("dispatch fullscreen 1")
-
-    def fullscreen(self):
-        self.focus()
-        if isinstance(self.window, NiriWindow):
-            niri_action("FullscreenWindow", {"id": self.window.id})
-        elif isinstance(self.window, HyprlandWindow):
-            hypr_command("dispatch fullscreen 0")
-
-    def toggle_floating(self):
-        self.focus()
-        if isinstance(self.window, NiriWindow):
-            niri_action("ToggleWindowFloating", {"id": self.window.id})
-        elif isinstance(self.window, HyprlandWindow):
-            hypr_command(f"dispatch togglefloating pid:{self.window.pid}")
-
-    def close(self):
-        if isinstance(self.window, NiriWindow):
-            niri_action("CloseWindow", {"id": self.window.id})
-        elif isinstance(self.window, HyprlandWindow):
-            hypr_command(f"dispatch closewindow pid:{self.window.pid}")
-
-
-class WindowFocusHistory:
-    """
-    Manages windows focus history.
-    Every time a new window is focused, ``sequence`` is increased by one,
-    and the window is assigned to the sequence.
-    """
-
-    initialized: bool = False
-    sequence: int = 0
-    focused_window_id: int = 0
-    # dict[win_id, hist_id]
-    focus_hist: dict[int, int] = {}
-
-    @classmethod
-    def get_focus_hist(cls, window_id: int):
-        """
-        Queries the focus sequence of the window.
-        """
-        return cls.focus_hist.get(window_id, 0)
-
-    @classmethod
-    def focus_window(cls, window_id: int):
-        """
-        Updates the current focused window id.
-        """
-        if cls.focused_window_id == window_id:
-            return
-
-        cls.sequence += 1
-        cls.focus_hist[window_id] = cls.sequence
-
-    @classmethod
-    def find_latest_index(cls, windows: list[WindowInfo] | None = None):
-        """
-        Finds the index of the latest focused window in ``windows``.
-        Returns ``-1`` if not found.
-        """
-        i = 0
-        idx = -1
-        latest = 0
-        for win in windows or []:
-            id = win.id
-            hist = cls.get_focus_hist(id)
-            if hist > latest:
-                idx = i
-                latest = hist
-            i += 1
-        return idx
-
-    @classmethod
-    def sync_windows(cls, windows: list[WindowInfo] | None = None):
-        if not windows:
-            cls.initialized = True
-            return
-
-        if cls.initialized:
-            id_set = None
-            if windows and len(windows) != len(cls.focus_hist):
-                id_set = set(w.id for w in windows)
-            if id_set:
-                for id in id_set:
-                    cls.focus_hist.pop(id, None)
-        else:
-            cls.initialized = True
-            if windows:
-                for id in [w.id for w in sorted(windows, key=lambda w: w.id)]:
-                    cls.focus_window(id)
-
-
 @gtk_template("appdock")
-class AppDockView(Gtk.Box):
+class AppDockView(Gtk.Box, SpecsBase):
     __gtype_name__ = "IgnisAppDockView"
 
     @gtk_template("appdock-item")
@@ -200,7 +75,9 @@ class AppDockView(Gtk.Box):
             SpecsBase.__init__(self)
 
             self.__idx: int = 0
+            self.__state: tuple | None = None
             self.__menu = IgnisMenuModel()
+            self.__menu_dirty: bool = True
             self.__dots_store = Gio.ListStore()
             self.dots.bind_model(self.__dots_store, lambda i: i)
             set_on_click(self.icon, left=WeakMethod(self.__on_clicked), right=WeakMethod(self.__on_right_clicked))
@@ -217,6 +94,32 @@ class AppDockView(Gtk.Box):
             self.dispose_template(self.__class__)
             super().do_dispose()  # type: ignore
 
+        def update(self, app_id: str, app_info: Application | None, windows: list[WindowInfo]) -> bool:
+            """
+            Applies ``app_id``, ``app_info`` and ``windows`` to the item,
+            skipping all the work if none of them changed since last update.
+            Returns whether the item is updated.
+            """
+            windows = sorted(windows, key=lambda w: w.id)
+            state = (
+                app_id,
+                app_info,
+                app_info is not None and app_info.is_pinned,
+                tuple(w.key for w in windows),
+                WindowFocusHistory.find_latest_index(windows),
+            )
+            if state == self.__state:
+                return False
+
+            self.__state = state
+            if app_id != self.__app_id:
+                self.app_id = app_id
+            self.app_info = app_info
+            # already sorted above
+            self.__set_sorted_windows(windows)
+            self.invalidate_menu()
+            return True
+
         @property
         def app_id(self) -> str:
             return self.__app_id
@@ -241,9 +144,11 @@ class AppDockView(Gtk.Box):
 
         @windows.setter
         def windows(self, windows: list[WindowInfo]):
+            self.__set_sorted_windows(sorted(windows, key=lambda w: w.id))
+
+        def __set_sorted_windows(self, windows: list[WindowInfo]):
             self.__dots_store.remove_all()
             if windows:
-                windows = sorted(windows, key=lambda w: w.id)
                 self.__windows = windows
 
                 idx = WindowFocusHistory.find_latest_index(windows)
@@ -273,7 +178,19 @@ class AppDockView(Gtk.Box):
                 dot.set_focused(focused)
                 self.__dots_store.append(dot)
 
+        def invalidate_menu(self):
+            """
+            Drops the context menu, which is rebuilt on the next right click.
+            """
+            if self.__menu_dirty:
+                return
+
+            self.__menu_dirty = True
+            self.menu.set_menu_model(None)
+            self.__menu.clean_gmenu()
+
         def rebuild_menu(self):
+            self.__menu_dirty = False
             self.menu.set_menu_model(None)
             self.__menu.clean_gmenu()
 
@@ -329,11 +246,7 @@ class AppDockView(Gtk.Box):
                 )
 
             # close all windows
-            def close_all_windows(wins: list[WindowInfo]):
-                for win in wins:
-                    win.close()
-
-            items.append(IgnisMenuItem("Close All Windows", True, lambda _: close_all_windows(windows)))
+            items.append(IgnisMenuItem("Close All Windows", True, lambda _: WindowInfo.close_all(windows)))
 
         def __launch_app(self, files: list[str] | None = None):
             if not self.app_info:
@@ -345,6 +258,7 @@ class AppDockView(Gtk.Box):
             launch_application(
                 self.app_info, files=files, command_format=command_format, terminal_format=terminal_format
             )
+            FrecencyService.get_default().record(self.app_info.id)
 
         def __on_clicked(self, *_):
             if self.windows:
@@ -353,6 +267,8 @@ class AppDockView(Gtk.Box):
                 self.__launch_app()
 
         def __on_right_clicked(self, *_):
+            if self.__menu_dirty:
+                self.rebuild_menu()
             self.menu.popup()
 
         def __on_scrolled(self, _, dx: float, dy: float):
@@ -370,28 +286,50 @@ class AppDockView(Gtk.Box):
             if self.app_info and files:
                 self.__launch_app(files)
 
+    @dataclasses.dataclass
+    class RefreshStats:
+        """
+        Counts dock items touched by a single refresh.
+        """
+
+        created: int = 0
+        removed: int = 0
+        updated: int = 0
+        unchanged: int = 0
+
+        @property
+        def changed(self) -> bool:
+            return self.created + self.removed + self.updated != 0
+
+        def add(self, other: "AppDockView.RefreshStats"):
+            self.created += other.created
+            self.removed += other.removed
+            self.updated += other.updated
+            self.unchanged += other.unchanged
+
+    instances: "weakref.WeakSet[AppDockView]" = weakref.WeakSet()
+
     conceal: Gtk.Revealer = gtk_template_child()
     revealer: Gtk.Revealer = gtk_template_child()
     flow_box: Gtk.FlowBox = gtk_template_child()
 
     def __init__(self):
         self.__dock_options = user_options.appdock
-        self.__apps = ApplicationsService.get_default()
+        self.__model = DockModel.get_default()
         self.__niri = NiriService.get_default()
-        self.__hypr = HyprlandService.get_default()
 
-        self.__windows: list[WindowInfo] = []
-        """Windows to display in dock."""
         self.__items: dict[str, AppDockView.Item] = {}
         """Maps ``app_id`` to ``DockItem``."""
-        self.__monitor_ws: set[int] = set()
-        """Workspace ids in the current monitor."""
-        self.__active_ws: set[int] = set()
-        """Focused workspace ids in any monitors."""
         self.__connector: str | None = None
         """Currently focused monitor connector/name."""
+        self.__refresh_stats = self.RefreshStats()
+        """Counters of the latest refresh."""
+        self.__refresh_totals = self.RefreshStats()
+        self.__refreshes: int = 0
+        self.instances.add(self)
 
         super().__init__()
+        SpecsBase.__init__(self)
 
         self.flow_box.set_sort_func(self.__dock_item_sorter)
 
@@ -405,31 +343,21 @@ class AppDockView(Gtk.Box):
         drop_target.connect("leave", self.__on_mouse_leave)
         self.add_controller(drop_target)
 
-        self.__apps.connect("notify::pinned", self.__on_pinned_changed)
+        self.__model.acquire()
+        self.signal(self.__model, "changed", self.__on_model_changed)
         if self.__niri.is_available:
-            WindowFocusHistory.sync_windows([WindowInfo(w) for w in self.__niri.windows])
-            self.__niri.connect("notify::workspaces", self.__on_workspaces_changed)
-            self.__niri.connect("notify::windows", self.__on_windows_changed)
-            self.__niri.connect(
-                "notify::active-window", lambda *_: WindowFocusHistory.focus_window(self.__niri.active_window.id)
-            )
-            self.__niri.connect("notify::active-window", self.__on_windows_changed)
-            self.__niri.connect("notify::overview-opened", self.__on_overview_changed)
-        if self.__hypr.is_available:
-            WindowFocusHistory.sync_windows([WindowInfo(w) for w in self.__hypr.windows])
-            self.__hypr.connect("notify::workspaces", self.__on_workspaces_changed)
-            self.__hypr.connect("notify::windows", self.__on_windows_changed)
-            self.__hypr.connect(
-                "notify::active-window", lambda *_: WindowFocusHistory.focus_window(self.__hypr.active_window.pid)
-            )
-            self.__hypr.connect("notify::active-window", self.__on_windows_changed)
-            for monitor in self.__hypr.monitors:
-                monitor.connect("notify::active-workspace-id", self.__on_workspaces_changed)
+            self.signal(self.__niri, "notify::overview-opened", self.__on_overview_changed)
         if self.__dock_options:
             connect_option(self.__dock_options, "auto_conceal", self.__on_auto_conceal_changed)
             connect_option(self.__dock_options, "monitor_only", self.__on_options_changed)
             connect_option(self.__dock_options, "workspace_only", self.__on_options_changed)
 
+    def do_dispose(self):
+        self.clear_specs()
+        self.__model.release()
+        self.dispose_template(self.__class__)
+        super().do_dispose()  # type: ignore
+
     def __on_state_flags_changed(self, *_):
         flags = self.get_state_flags()
         prelight = Gtk.StateFlags.PRELIGHT & flags != 0
@@ -447,6 +375,7 @@ class AppDockView(Gtk.Box):
         if monitor:
             self.__connector = monitor.get_connector()
         self.__on_auto_conceal_changed()
+        self.__refresh()
 
     def __on_overview_changed(self, *_):
         if self.__dock_options and self.__dock_options.show_in_overview:
@@ -497,70 +426,69 @@ class AppDockView(Gtk.Box):
         return (ka > kb) - (ka < kb)
 
     def __on_options_changed(self, *_):
-        self.__on_workspaces_changed()
-
-    def __on_pinned_changed(self, *_):
         self.__refresh()
 
-    def __on_workspaces_changed(self, *_):
-        if self.__niri.is_available:
-            self.__monitor_ws = set(ws.id for ws in self.__niri.workspaces if ws.output == self.__connector)
-            self.__active_ws = set(ws.id for ws in self.__niri.workspaces if ws.is_active)
-        elif self.__hypr.is_available:
-            self.__monitor_ws = set(ws.id for ws in self.__hypr.workspaces if ws.monitor == self.__connector)
-            self.__active_ws = set(m.active_workspace_id for m in self.__hypr.monitors)
-        else:
-            return
-
-        self.__on_windows_changed()
-
-    def __on_windows_changed(self, *_):
-        self.__windows = [
-            WindowInfo(win) for win in (self.__niri.windows if self.__niri.is_available else self.__hypr.windows)
-        ]
-        if self.__dock_options.monitor_only:
-            self.__windows = [win for win in self.__windows if win.workspace_id in self.__monitor_ws]
-        elif self.__dock_options.workspace_only:
-            self.__windows = [win for win in self.__windows if win.workspace_id in self.__monitor_ws & self.__active_ws]
+    @classmethod
+    def report(cls) -> str:
+        """
+        Formats refresh counters of all living docks as a table, totals and the latest refresh.
+        """
+        lines = [f"{'refreshes':>10} {'created':>8} {'removed':>8} {'updated':>8} {'unchanged':>10}  monitor"]
+        for view in cls.instances:
+            connector = view.__connector or "-"
+            totals, latest = view.__refresh_totals, view.__refresh_stats
+            lines.append(
+                f"{view.__refreshes:>10} {totals.created:>8} {totals.removed:>8} {totals.updated:>8} "
+                f"{totals.unchanged:>10}  {connector}"
+            )
+            lines.append(
+                f"{'latest':>10} {latest.created:>8} {latest.removed:>8} {latest.updated:>8} "
+                f"{latest.unchanged:>10}  {connector}"
+            )
+        return "\n".join(lines)
 
+    def __on_model_changed(self, *_):
         self.__refresh()
 
     def __refresh(self):
-        pinned_set = {get_app_id(app.id) for app in self.__apps.pinned if app.id}
+        stats = self.RefreshStats()
+
+        monitor_only = bool(self.__dock_options and self.__dock_options.monitor_only)
+        workspace_only = bool(self.__dock_options and self.__dock_options.workspace_only)
+        view = self.__model.get_view(self.__connector, monitor_only, workspace_only)
+        app_windows = view.app_windows
         # all the items to display: pinned apps and open windows
-        app_id_set = pinned_set | ({get_app_id(win.app_id) for win in self.__windows})
-        # map app id to app info
-        app_dict = {get_app_id(app.id): app for app in self.__apps.apps if app.id}
+        app_id_set = view.pinned | app_windows.keys()
 
         # remove dock items that are not in app_id_set
         for app_id in [app_id for app_id in self.__items if app_id not in app_id_set]:
             dock_item = self.__items.pop(app_id)
             self.flow_box.remove(dock_item)
             dock_item.run_dispose()
-        # create missing dock items from app_id_set
+            stats.removed += 1
+
+        # create missing dock items, and update the ones whose windows, focus or pin state changed
         for app_id in app_id_set:
             dock_item = self.__items.get(app_id)
             if not dock_item:
                 dock_item = self.Item()
                 self.__items[app_id] = dock_item
                 self.flow_box.append(dock_item)
-            dock_item.app_id = app_id
-            dock_item.app_info = app_dict.get(app_id)
-
-        # sync open windows to dock items
-        app_windows: dict[str, list[WindowInfo]] = {}
-        for window in self.__windows:
-            app_id = get_app_id(window.app_id)
-            if app_id not in app_windows:
-                app_windows[app_id] = []
-            app_windows[app_id].append(window)
-        for app_id, item in self.__items.items():
-            item.windows = app_windows.get(app_id, [])
-
-        # refresh flow_box
-        for item in self.__items.values():
-            item.rebuild_menu()
-        self.flow_box.invalidate_sort()
+                stats.created += 1
+                dock_item.update(app_id, view.app_dict.get(app_id), app_windows.get(app_id, []))
+            elif dock_item.update(app_id, view.app_dict.get(app_id), app_windows.get(app_id, [])):
+                stats.updated += 1
+            else:
+                stats.unchanged += 1
+
+        if stats.changed:
+            self.flow_box.invalidate_sort()
+
+        self.__refresh_stats = stats
+        self.__refresh_totals.add(stats)
+        self.__refreshes += 1
+        # formatted lazily, only if debug logging is enabled
+        logger.debug("[AppDock] {}: {}", self.__connector, stats)
 
 
 class AppDock(Window):
@@ -1,14 +1,20 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
-from gi.repository import Gdk, Gio, GObject, Gtk
+from gi.repository import Gdk, Gio, GLib, GObject, Gtk
 from ignis.menu_model import IgnisMenuItem, IgnisMenuModel, IgnisMenuSeparator, ItemsType
 from ignis.services.applications import Application, ApplicationAction, ApplicationsService
 from ignis.widgets import Window
+from loguru import logger
 
 from ..constants import WindowName
+from ..services import FrecencyService
 from ..useroptions import user_options
 from ..utils import (
+    AppSearchIndex,
     SpecsBase,
+    bind_option,
     connect_option,
     connect_window,
     get_app_icon_name,
@@ -124,6 +130,8 @@ class AppLauncherView(Gtk.Box):
     class Factory(Gtk.SignalListItemFactory):
         def __init__(self):
             super().__init__()
+            self.pool: list[AppLauncherGridItem] = []
+            """Pre-created items, used before creating new ones."""
 
             self.connect("setup", self.__class__.__item_setup)
             self.connect("bind", self.__class__.__item_bind)
@@ -131,7 +139,7 @@ class AppLauncherView(Gtk.Box):
             self.connect("teardown", self.__class__.__item_teardown)
 
         def __item_setup(self, item: Gtk.ListItem):
-            item.set_child(AppLauncherGridItem())
+            item.set_child(self.pool.pop() if self.pool else AppLauncherGridItem())
 
         def __item_bind(self, item: Gtk.ListItem):
             app = item.get_item()
@@ -150,20 +158,102 @@ class AppLauncherView(Gtk.Box):
             if isinstance(grid_item, AppLauncherGridItem):
                 grid_item.run_dispose()
 
+    PREWARM_ROWS = 20
+    """Number of rows to pre-create, enough to fill the first screen."""
+
     def __init__(self):
         self.__service = ApplicationsService.get_default()
+        self.__frecency = FrecencyService.get_default()
         super().__init__()
 
-        self.__filter = Gtk.CustomFilter()
-        self.__sorter = Gtk.CustomSorter()
-        self.app_grid.set_factory(self.Factory())
+        self.__factory = self.Factory()
+        self.__prewarm_source: int | None = None
+        self.__prewarm_icons: list[Gtk.IconPaintable] = []
+        self.__open_time: float | None = None
+        self.__first_frame_ms: float | None = None
+
+        self.__index = AppSearchIndex()
+        self.__search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="applauncher-search")
+        """Owns ``__index``, so that it's only accessed from a single worker thread."""
+        self.__search_generation: int = 0
+        """Increased on every query, results of older generations are dropped."""
+        self.__search_text: str = ""
+        self.__search_result: dict[str, int] | None = None
+        """Maps app ids of matched applications to their rank, ``None`` if not searching."""
+        self.__scores: dict[str, float] = {}
+        """Frecency scores taken on every opening, replaced rather than changed, so shared with the search worker."""
+        self.__filter = Gtk.CustomFilter.new(self.__apps_filter)
+        self.__sorter = Gtk.CustomSorter.new(self.__apps_sorter)
+        self.app_grid.set_factory(self.__factory)
         self.filter_list.set_filter(self.__filter)
         self.sort_list.set_sorter(self.__sorter)
 
-        self.__service.connect("notify::apps", self.__on_apps_changed)
+        self.__apps_handler = self.__service.connect("notify::apps", self.__on_apps_changed)
+        self.connect("destroy", self.__on_destroy)
         connect_window(self, "notify::visible", self.__on_window_visible_change)
 
         self.__app_options = user_options and user_options.applauncher
+        if self.__app_options:
+            connect_option(self.__app_options, "prewarm", self.__on_prewarm_changed)
+            self.__on_prewarm_changed()
+            bind_option(
+                self.__app_options,
+                "search_debounce",
+                self.search_entry,
+                "search-delay",
+                GObject.BindingFlags.DEFAULT,
+            )
+
+        # built lazily, apps are usually loaded already and notify::apps won't fire
+        self.__on_apps_changed()
+
+    @property
+    def first_frame_ms(self) -> float | None:
+        """
+        Milliseconds from the latest opening to its first painted frame.
+        """
+        return self.__first_frame_ms
+
+    def __on_prewarm_changed(self, *_):
+        if self.__app_options and self.__app_options.prewarm:
+            self.prewarm()
+
+    def prewarm(self):
+        """
+        Creates rows of the first screen and resolves their icons in idle time, one row per iteration.
+        """
+        if self.__prewarm_source is not None:
+            return
+
+        icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())  # type: ignore
+        position = 0
+
+        def step() -> bool:
+            nonlocal position
+            if position >= self.PREWARM_ROWS or len(self.__factory.pool) >= self.PREWARM_ROWS:
+                self.__prewarm_source = None
+                logger.debug(f"[AppLauncher] pre-warmed {len(self.__factory.pool)} rows")
+                return GLib.SOURCE_REMOVE
+
+            grid_item = AppLauncherGridItem()
+            app = self.selection.get_item(position)
+            if isinstance(app, Application):
+                grid_item.application = app
+                icon = icon_theme.lookup_icon(
+                    get_app_icon_name(app_info=app), None, 32, self.get_scale_factor(), Gtk.TextDirection.NONE, 0
+                )
+                # keep icons referenced until the launcher is shown
+                self.__prewarm_icons.append(icon)
+                grid_item.application = None
+            self.__factory.pool.append(grid_item)
+            position += 1
+            return GLib.SOURCE_CONTINUE
+
+        self.__prewarm_source = GLib.idle_add(step, priority=GLib.PRIORITY_LOW)
+
+    def __on_destroy(self, *_):
+        self.__service.disconnect(self.__apps_handler)
+        self.__search_executor.shutdown(wait=False, cancel_futures=True)
 
     def __on_apps_changed(self, *_):
         self.list_store.remove_all()
@@ -171,11 +261,13 @@ class AppLauncherView(Gtk.Box):
         apps = self.__service.apps
         for app in apps:
             self.list_store.append(app)
+        self.__search_executor.submit(self.__index.rebuild, apps)
 
     def launch_application(self, app: Application):
         command_format = self.__app_options and self.__app_options.command_format
         terminal_format = self.__app_options and self.__app_options.terminal_format
         launch_application(app, command_format=command_format, terminal_format=terminal_format)
+        self.__frecency.record(app.id)
 
     def __move_selection(self, delta: int):
         pos, count = self.selection.get_selected(), self.selection.get_n_items()
@@ -194,11 +286,39 @@ class AppLauncherView(Gtk.Box):
     def __on_window_visible_change(self, window: Window, _):
         if not window.get_visible():
             self.search_bar.set_search_mode(False)
+            self.__prewarm_icons.clear()
+            return
 
-    def __apps_filter(self, app: Application, result: dict[str, int]) -> bool:
-        return app.id in result
-
-    def __apps_sorter(self, a: Application, b: Application, result: dict[str, int]) -> int:
+        # scores decay over time and change on launches
+        self.__scores = self.__frecency.scores()
+        if self.__search_result is None:
+            self.__sorter.changed(Gtk.SorterChange.DIFFERENT)
+
+        self.__open_time = time.perf_counter()
+        self.add_tick_callback(self.__on_first_tick)
+
+    def __on_first_tick(self, _, frame_clock: Gdk.FrameClock) -> bool:
+        def on_after_paint(frame_clock: Gdk.FrameClock):
+            frame_clock.disconnect(handler)
+            if self.__open_time is not None:
+                self.__first_frame_ms = (time.perf_counter() - self.__open_time) * 1000
+                self.__open_time = None
+                logger.info(f"[AppLauncher] first frame painted in {self.__first_frame_ms:.1f} ms")
+
+        handler = frame_clock.connect("after-paint", on_after_paint)
+        return GLib.SOURCE_REMOVE
+
+    def __apps_filter(self, app: Application, *_) -> bool:
+        result = self.__search_result
+        return result is None or app.id in result
+
+    def __apps_sorter(self, a: Application, b: Application, *_) -> int:
+        result = self.__search_result
+        if result is None:
+            # sort by frecency, the most likely app at the top
+            scores = self.__scores
+            fa, fb = a.id and scores.get(a.id) or 0, b.id and scores.get(b.id) or 0
+            return (fa < fb) - (fa > fb)
         pa, pb = a.id and result.get(a.id), b.id and result.get(b.id)
         return (pa or 0) - (pb or 0)
 
@@ -223,20 +343,40 @@ class AppLauncherView(Gtk.Box):
     @gtk_template_callback
     def on_search_changed(self, *_):
         search_text = self.search_entry.get_text()
+        self.__search_generation += 1
+        generation = self.__search_generation
+
         if search_text != "":
-            search_result = {
-                app_id: priority
-                for priority, result in enumerate(Gio.DesktopAppInfo.search(search_text))
-                for app_id in result
-            }
-            self.__filter.set_filter_func(self.__apps_filter, search_result)
-            self.__sorter.set_sort_func(self.__apps_sorter, search_result)
+            # frecency is read and updated on the main thread, so the worker gets the snapshot
+            self.__search_executor.submit(self.__search_worker, generation, search_text, self.__scores)
 
             if not self.search_bar.get_search_mode():
                 self.search_bar.set_search_mode(True)
         else:
-            self.__filter.set_filter_func(None)
-            self.__sorter.set_sort_func(None)
+            self.__apply_search_result(generation, "", None)
+
+    def __search_worker(self, generation: int, search_text: str, scores: dict[str, float]):
+        # skip queries superseded while waiting in the queue
+        if generation != self.__search_generation:
+            return
+
+        result = self.__index.search(search_text, lambda app_id: scores.get(app_id, 0))
+        GLib.idle_add(lambda *_: self.__apply_search_result(generation, search_text, result))
+
+    def __apply_search_result(self, generation: int, search_text: str, result: dict[str, int] | None):
+        if generation != self.__search_generation:
+            return
+
+        previous_text, self.__search_text = self.__search_text, search_text
+        previous_result, self.__search_result = self.__search_result, result
+        if result is not None:
+            # an extended query only narrows down the matched apps, so unmatched ones are not filtered again
+            extended = previous_result is not None and search_text.startswith(previous_text)
+            self.__filter.changed(Gtk.FilterChange.MORE_STRICT if extended else Gtk.FilterChange.DIFFERENT)
+            self.__sorter.changed(Gtk.SorterChange.DIFFERENT)
+        elif previous_result is not None:
+            self.__filter.changed(Gtk.FilterChange.LESS_STRICT)
+            self.__sorter.changed(Gtk.SorterChange.DIFFERENT)
 
     @gtk_template_callback
     def on_search_next(self, *_):
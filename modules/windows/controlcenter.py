@@ -13,11 +13,11 @@ from ignis.services.network import NetworkService
 from ignis.services.notifications import NOTIFICATIONS_IMAGE_DATA, Notification, NotificationAction, NotificationService
 from ignis.services.power_profiles import PowerProfilesService
 from ignis.services.recorder import RecorderConfig, RecorderService
-from ignis.utils import AsyncCompletedProcess, Poll
+from ignis.utils import AsyncCompletedProcess
 from ignis.widgets import Icon, Window
-from ignis.window_manager import WindowManager
 
 from ..constants import AudioStreamType, WindowName
+from ..services import LazyWindowRegistry, TickerService
 from ..useroptions import user_options
 from ..utils import (
     GProperty,
@@ -26,21 +26,22 @@ from ..utils import (
     clear_dir,
     connect_option,
     connect_window,
-    ensure_ui_file,
     escape_pango_markup,
     gtk_template,
     gtk_template_callback,
     gtk_template_child,
+    new_builder,
     niri_action,
     run_cmd_async,
     set_on_click,
+    status_cmd_runner,
     verify_pango_markup,
 )
 from ..variables import caffeine_state
 from ..widgets import RevealerWindow
 from .backdrop import overlay_window
 
-wm = WindowManager.get_default()
+registry = LazyWindowRegistry.get_default()
 
 
 @gtk_template("controlcenter/audio-group")
@@ -140,13 +141,20 @@ class AudioControlGroup(Gtk.Box):
         set_on_click(self.caption, left=self.__on_caption_clicked)
         connect_window(self, "notify::visible", self.__on_window_visible_change)
 
+        streams: list[Stream] = []
         match stream_type:
             case AudioStreamType.speaker:
                 self._default = self.__service.speaker
                 self.__service.connect("speaker_added", self.__on_stream_added)
+                streams = self.__service.speakers
             case AudioStreamType.microphone:
                 self._default = self.__service.microphone
                 self.__service.connect("microphone_added", self.__on_stream_added)
+                streams = self.__service.microphones
+
+        # streams added before the control center is built
+        for stream in streams:
+            self.__on_stream_added(self.__service, stream)
 
         if self._default is not None:
             self._default.connect("notify::description", self.__on_volume_changed)
@@ -434,7 +442,7 @@ class ControlSwitchPill(Gtk.Button):
         super().__init__()
         self.set_css_classes(["m-1", "rounded"])
 
-        builder = Gtk.Builder.new_from_file(ensure_ui_file("controlcenter/switchpill"))
+        builder = new_builder("controlcenter/switchpill")
         self._pill: Gtk.Box = builder.get_object("pill")  # type: ignore
         self._icon: Gtk.Image = builder.get_object("icon")  # type: ignore
         self._title: Gtk.Inscription = builder.get_object("title")  # type: ignore
@@ -467,7 +475,7 @@ class ControlSwitchCmd(ControlSwitchPill):
 
     def __init__(self):
         self._enabled: bool = False
-        self._poll: Poll | None = None
+        self._poll: TickerService.Task | None = None
         self._poll_interval: int = 0
         self._status_cmd: str = ""
         self._enable_cmd: str = ""
@@ -506,12 +514,15 @@ class ControlSwitchCmd(ControlSwitchPill):
     def poll_interval(self, interval: int):
         self._poll_interval = interval
 
-        if self._poll:
-            self._poll.cancel()
-            self._poll = None
-
-        if interval != 0:
-            self._poll = Poll(timeout=interval, callback=self.__run_status_cmd)
+        if interval == 0:
+            if self._poll:
+                self._poll.cancel()
+                self._poll = None
+        elif self._poll:
+            self._poll.set_interval(interval)
+        else:
+            # paused while the control center is hidden, and refreshed once on revealed
+            self._poll = TickerService.get_default().add(interval, self.__run_status_cmd, widget=self)
 
     @GProperty(type=str)
     def status_cmd(self) -> str:
@@ -599,7 +610,7 @@ class ControlSwitchCmd(ControlSwitchPill):
                 self._enabled = task.result().returncode == 0
                 self.__on_status_changed()
 
-            run_cmd_async(self.status_cmd, on_done=on_cmd_done)
+            status_cmd_runner.run(self.status_cmd, on_done=on_cmd_done)
 
 
 class ColorSchemeSwitcher(ControlSwitchPill):
@@ -693,7 +704,7 @@ class IgnisRecorder(ControlSwitchPill):
             else:
                 self.__service.stop_recording()
         else:
-            wm.close_window(WindowName.control_center.value)
+            registry.close_window(WindowName.control_center.value)
             create_task(self.__service.start_recording(RecorderConfig.new_from_options()))
 
     def __on_right_clicked(self, *_):
@@ -749,6 +760,7 @@ class CaffeineSwitch(ControlSwitchPill):
 
         self.__state.connect("notify::value", self.__on_changed)
         self.set_on_click(self.__on_clicked)
+        self.__on_changed()
 
     def __on_changed(self, *_):
         enabled = self.__state.value == True
@@ -847,6 +859,7 @@ class WifiStatus(ControlSwitchPill):
         self.__wifi.connect("notify::icon-name", self.__on_status_changed)
         self.__wifi.connect("notify::devices", self.__on_status_changed)
         self.set_on_click(self.__on_clicked)
+        self.__on_status_changed()
 
     def __on_status_changed(self, *_):
         self.set_icon(self.__wifi.icon_name)
@@ -891,6 +904,8 @@ class BluetoothStatus(ControlSwitchPill):
         self.__service.connect("notify::devices", self.__on_devices_changed)
         self.__devices_signals: list[tuple[BluetoothDevice, int]] = []
         self.set_on_click(self.__on_clicked)
+        self.__on_devices_changed()
+        self.__on_status_changed()
 
     def __on_devices_changed(self, *_):
         for device, id in self.__devices_signals:
@@ -1060,7 +1075,7 @@ class NotificationItem(Gtk.ListBoxRow, SpecsBase):
             return
 
         if self.is_popup:
-            wm.open_window(WindowName.control_center.value)
+            registry.open_window(WindowName.control_center.value)
 
     def __on_right_clicked(self, *_):
         if not self.revealer.get_reveal_child():
@@ -1074,7 +1089,7 @@ class NotificationItem(Gtk.ListBoxRow, SpecsBase):
     def __on_action(self, action: NotificationAction):
         def callback(_):
             action.invoke()
-            wm.close_window(WindowName.control_center.value)
+            registry.close_window(WindowName.control_center.value)
 
         return callback
 
@@ -1163,6 +1178,10 @@ class NotificationPopups(RevealerWindow):
 
         self._popups.connect("notify::n-items", self.__on_store_changed)
         self.__service.connect("new_popup", self.__on_new_popup)
+        # popups arrived before the window is built, the latest at the top
+        for popup in self.__service.popups:
+            self.__on_new_popup(self.__service, popup)
+        self.__on_store_changed()
 
     def __on_store_changed(self, *_):
         if self._popups.get_n_items() != 0:
@@ -36,6 +36,8 @@ class Preferences(AdwRegularWindow):
         exclusive_focus: Adw.SwitchRow = gtk_template_child()
         command_format: Adw.EntryRow = gtk_template_child()
         terminal_format: Adw.EntryRow = gtk_template_child()
+        applauncher_search_debounce: Adw.SpinRow = gtk_template_child()
+        applauncher_prewarm: Adw.SwitchRow = gtk_template_child()
         on_active_click: Adw.EntryRow = gtk_template_child()
         on_active_right_click: Adw.EntryRow = gtk_template_child()
         on_active_middle_click: Adw.EntryRow = gtk_template_child()
@@ -53,6 +55,8 @@ class Preferences(AdwRegularWindow):
         fcitx_kimpanel_enabled: Adw.SwitchRow = gtk_template_child()
         fcitx_show_popup: Adw.SwitchRow = gtk_template_child()
         fcitx_vertical_list: Adw.SwitchRow = gtk_template_child()
+        startup_gresource_bundle: Adw.SwitchRow = gtk_template_child()
+        startup_prebuild_windows: Adw.SwitchRow = gtk_template_child()
 
         def __init__(self):
             super().__init__()
@@ -89,6 +93,14 @@ class Preferences(AdwRegularWindow):
             bind_option(user_options.applauncher, "exclusive_focus", self.exclusive_focus, "active")
             bind_option(user_options.applauncher, "command_format", self.command_format, "text")
             bind_option(user_options.applauncher, "terminal_format", self.terminal_format, "text")
+            bind_option(
+                user_options.applauncher,
+                "search_debounce",
+                self.applauncher_search_debounce,
+                "value",
+                transform_from=lambda f: round(f),
+            )
+            bind_option(user_options.applauncher, "prewarm", self.applauncher_prewarm, "active")
 
             # active window indicator
             bind_option(user_options.activewindow, "on_click", self.on_active_click, "text")
@@ -119,6 +131,10 @@ class Preferences(AdwRegularWindow):
             # on screen display
             bind_option(user_options.osd, "timeout", self.osd_timeout, "value")
 
+            # startup
+            bind_option(user_options.startup, "gresource_bundle", self.startup_gresource_bundle, "active")
+            bind_option(user_options.startup, "prebuild_windows", self.startup_prebuild_windows, "active")
+
             # topbar
             bind_option(user_options.topbar, "exclusive", self.topbar_exclusive, "active")
             bind_option(user_options.topbar, "focusable", self.topbar_focusable, "active")
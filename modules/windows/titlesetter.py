@@ -1,16 +1,14 @@
 from gi.repository import Gtk, Gdk, GLib
 from loguru import logger
 from ..widgets import RevealerWindow
-from ..utils import get_widget_monitor
+from ..utils import LazyModule, get_widget_monitor
 from ..utils.template import gtk_template, gtk_template_child, gtk_template_callback
 from ..utils.widget import connect_window
-import os, re, threading, requests, datetime
+import os, re, threading, datetime
 
-try:
-    import pyatspi
-    HAS_MAGIC = True
-except:
-    HAS_MAGIC = False
+# only needed by the magic button, imported on first click
+requests = LazyModule("requests")
+pyatspi = LazyModule("pyatspi")
 
 from ..constants import WindowName
 from ignis.services.niri import NiriService
@@ -75,6 +73,7 @@ class TitleSetter(RevealerWindow):
         
         # Connect signals
         self._niri.connect("notify::active-window", self._on_focus)
+        self._on_focus()
         connect_window(self, "notify::visible", self._on_show)
         self.child.monitor_combo.connect("changed", self._on_monitor_changed)
         
@@ -142,9 +141,8 @@ class TitleSetter(RevealerWindow):
             self._validate_input()
             
             # Disable magic button if dependencies are missing
-            self.child.magic_button.set_sensitive(HAS_MAGIC)
-            if not HAS_MAGIC:
-                self.child.magic_button.set_tooltip_text("Missing 'pyatspi' dependency")
+            if not pyatspi.available:
+                self._disable_magic()
 
     def _populate_monitors(self):
         combo = self.child.monitor_combo
@@ -221,7 +219,17 @@ class TitleSetter(RevealerWindow):
         # Running in thread prevents UI hanging
         threading.Thread(target=self._magic_worker, args=(target_info, self._generation_id), daemon=True).start()
 
+    def _disable_magic(self):
+        self.child.magic_button.set_sensitive(False)
+        self.child.magic_button.set_tooltip_text("Missing 'pyatspi' dependency")
+
     def _magic_worker(self, target_info, gen_id):
+        # a broken installation only shows up once imported
+        if pyatspi.try_load() is None:
+            GLib.idle_add(self._finish_magic, "❌ Missing 'pyatspi' dependency")
+            GLib.idle_add(self._disable_magic)
+            return
+
         if gen_id != self._generation_id: return
         tabs = self._scan_tabs(target_info)
         